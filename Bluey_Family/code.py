@@ -5,6 +5,7 @@
 This code simply displays an image of the children's character Bluey and their family.
 The point is to show to quality of the display that is being used in this kit. 
 """
+import time
 import board
 import displayio
 import adafruit_imageload
@@ -89,8 +90,10 @@ group.y = int((DISPLAY_HEIGHT / 2) - (LOGO_HEIGHT / 2))   #70
 
 
 
+# Nothing left to do - idle instead of busy-waiting so USB and background
+# tasks stay responsive
 while True:
-    pass
+    time.sleep(60)
 
 
 
@@ -25,15 +25,15 @@ pixels = neopixel.NeoPixel(
     board.NEOPIXEL,
     1,
     brightness=0.25,
-    auto_write=True,
+    auto_write=False,  # call pixels.show() once after each update
 )
 
 # -----------------------
 # Button edge-detect / debounce
 # -----------------------
 last_btn = True
-last_edge_t = 0.0
-DEBOUNCE_S = 0.05
+last_edge_t = 0
+DEBOUNCE_NS = 50_000_000  # 50 ms, integer nanoseconds avoid float math
 
 #--------------------
 # Touch sensor state
@@ -47,6 +47,7 @@ colors = [ (0, 0, 255),(0, 255, 0),(255, 0, 0)]
 colors_text = ["Blue", "Green", "Red"]
 color_i = 0
 pixels[0] = colors[color_i]
+pixels.show()
 
 # -----------------------
 # Rainbow helpers (adapted from boardtest_neopixel.py)
@@ -61,6 +62,13 @@ def wheel(pos: int):
     pos -= 170
     return (pos * 3, 0, 255 - pos * 3)
 
+# Precompute the whole wheel once as R,G,B byte triplets so the
+# animation loop is a table lookup instead of a function call
+WHEEL = bytearray(768)
+for p in range(256):
+    WHEEL[p * 3:p * 3 + 3] = bytes(wheel(p))
+del wheel
+
 #--------------------------------------
 # Animation phase
 #--------------------------------------
@@ -70,28 +78,36 @@ rainbow_step = 0
 # Main loop
 # -----------------------
 while True:
-    now = time.monotonic()
     # Read both the Cap touch pad and User button
     cur_btn = button.value  # Active LOW -> True=not pressed, False=pressed
     current_touch = touch.value # Active HIGH -> True=pressed, False=not pressed
 
-    if (current_touch and not last_touch):
-        # Rainbow mode while CAP1 is touched
-        rainbow_mode = True
+    # Rainbow mode only while CAP1 is touched
+    rainbow_mode = current_touch
+    if (rainbow_mode and not last_touch):
         print("Rainbow mode!")
+    elif (last_touch and not rainbow_mode):
+        # Released - go back to the current solid color
+        pixels[0] = colors[color_i]
+        pixels.show()
+
     if (rainbow_mode):    
-        pixels[0] = wheel(rainbow_step & 255)  # single-pixel rainbow
+        i = (rainbow_step & 255) * 3
+        pixels[0] = (WHEEL[i], WHEEL[i + 1], WHEEL[i + 2])  # single-pixel rainbow
+        pixels.show()
         rainbow_step = (rainbow_step + 3) & 255       
-        time.sleep(0.02)  # smooth animation
     else:
         # Solid color mode: detect button press to advance color
-        if (last_btn is True) and (cur_btn is False) and ((now - last_edge_t) > DEBOUNCE_S):
-            last_edge_t = now
-            print("Primary color mode!")
-            color_i = (color_i + 1) % len(colors)
-            pixels[0] = colors[color_i]
-        time.sleep(0.01)
+        if (last_btn is True) and (cur_btn is False):
+            now = time.monotonic_ns()  # only needed when debouncing an edge
+            if (now - last_edge_t) > DEBOUNCE_NS:
+                last_edge_t = now
+                print("Primary color mode!")
+                color_i = (color_i + 1) % len(colors)
+                pixels[0] = colors[color_i]
+                pixels.show()
 
     last_btn = cur_btn
     last_touch = current_touch
+    time.sleep(0.02)  # one tick for both modes
 
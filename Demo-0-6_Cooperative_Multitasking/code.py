@@ -14,7 +14,7 @@ except ImportError:
 
 pixel_pin = board.NEOPIXEL
 num_pixels = 5
-pixels = neopixel.NeoPixel(pixel_pin, num_pixels, brightness=0.05, auto_write=True)
+pixels = neopixel.NeoPixel(pixel_pin, num_pixels, brightness=0.05, auto_write=False)
 
 NEOPIXEL_RED = (255, 0, 0)
 NEOPIXEL_YELLOW = (255, 150, 0)
@@ -23,24 +23,41 @@ NEOPIXEL_BLUE = (0, 0, 255)
 NEOPIXEL_OFF = (0, 0, 0)
 NEOPIXEL_RANDOM = (random.randrange(255), random.randrange(255), random.randrange(255))
 
-# pixel is neopixel number, count is for-loop counter, interval is blink rate, color_value is one of the colors previously defined
-async def blinks(pixel, interval, count, color_value):
-	for _ in range(count):
-		pixels[pixel] = color_value
-		await asyncio.sleep(interval)   
-		pixels[pixel] = NEOPIXEL_OFF
-		await asyncio.sleep(interval)   
+# One entry per blinking pixel: pixel is neopixel number, period is blink rate, count is
+# how many blinks are left, color is one of the colors previously defined, next is when
+# it toggles next and state is whether it is currently lit
+schedule = [
+    {"pixel": 0, "period": 0.30, "count": 15, "color": NEOPIXEL_RANDOM, "next": 0.0, "state": False},
+    {"pixel": 1, "period": 0.75, "count": 10, "color": NEOPIXEL_GREEN, "next": 0.0, "state": False},
+    {"pixel": 2, "period": 1.0,  "count": 10, "color": NEOPIXEL_RED, "next": 0.0, "state": False},
+    {"pixel": 3, "period": 0.50, "count": 10, "color": NEOPIXEL_YELLOW, "next": 0.0, "state": False},
+    {"pixel": 4, "period": 0.25, "count": 15, "color": NEOPIXEL_BLUE, "next": 0.0, "state": False},
+]
+
+# A single task walks the schedule every tick and toggles whichever pixels are due,
+# then sends all the changes to the NeoPixels with one show()
+async def blink_driver():
+	while any(s["count"] > 0 for s in schedule):
+		now = time.monotonic()
+		changed = False
+		for s in schedule:
+			if s["count"] > 0 and now >= s["next"]:
+				s["state"] = not s["state"]
+				pixels[s["pixel"]] = s["color"] if s["state"] else NEOPIXEL_OFF
+				s["next"] = now + s["period"]
+				if not s["state"]:
+					s["count"] -= 1
+				changed = True
+		if changed:
+			pixels.show()
+		await asyncio.sleep(0.01)
 print("Start") # So we know that it actually started!
 
 async def main():
-    pixel_task1 = asyncio.create_task(blinks(0, 0.30, 15, NEOPIXEL_RANDOM ))
-    pixel_task2 = asyncio.create_task(blinks(1, 0.75, 10, NEOPIXEL_GREEN))
-    pixel_task3 = asyncio.create_task(blinks(2, 1.0,  10, NEOPIXEL_RED))
-    pixel_task4 = asyncio.create_task(blinks(3, 0.50, 10, NEOPIXEL_YELLOW))
-    pixel_task5 = asyncio.create_task(blinks(4, 0.25, 15, NEOPIXEL_BLUE))
+    driver_task = asyncio.create_task(blink_driver())
 
 # gather statement initiates the task loop and passes control to the first in the list - await is mandatory
-    await asyncio.gather(pixel_task1, pixel_task2, pixel_task3, pixel_task4, pixel_task5)
+    await asyncio.gather(driver_task)
     print("Finished") # So we know that it actually finished!
 
 asyncio.run(main())
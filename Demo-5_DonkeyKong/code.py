@@ -8,12 +8,19 @@ Uses bitmap sprites: DK.bmp, princess.bmp, mario.bmp
 """
 import time
 import board
+# asyncio runs the game as cooperative tasks
+# Make sure it is in D:\CIRCUITPY\lib folder!
+import asyncio
 import adafruit_icm20x
+import struct
 import displayio
+import bitmaptools
 import adafruit_imageload
 import digitalio
 import microcontroller
 import neopixel
+from micropython import const
+from ulab import numpy as np
 from adafruit_display_shapes.rect import Rect
 from adafruit_display_shapes.circle import Circle
 
@@ -45,15 +52,45 @@ from adafruit_st7789 import ST7789
 i2c = board.I2C()  # uses board.SCL and board.SDA
 
 try:
-    icm = adafruit_icm20x.ICM20948(i2c, 0x68)
+    icm_address = 0x68
+    icm = adafruit_icm20x.ICM20948(i2c, icm_address)
     print("ICM20948 found at address 0x68")
 except:
     print("No ICM20948 found at default address 0x68. Trying alternate address 0x69.")
     try:
-        icm = adafruit_icm20x.ICM20948(i2c, 0x69)
+        icm_address = 0x69
+        icm = adafruit_icm20x.ICM20948(i2c, icm_address)
         print("ICM20948 found at address 0x69")
     except:
         print("ERROR: No ICM20948 found!")
+        icm = None
+
+# The game only uses X acceleration, so instead of icm.acceleration (which
+# reads and scales all three axes) burst-read just the two ACCEL_XOUT
+# registers in a single I2C transaction
+ACCEL_XOUT_H = b"\x2D"  # user bank 0
+accel_buf = bytearray(2)
+
+def setup_accel_x(imu):
+    """Point read_accel_x() at an ICM20948 and select its user bank 0"""
+    global icm_i2c, accel_scale
+    icm_i2c = imu.i2c_device
+    accel_scale = adafruit_icm20x.G_TO_ACCEL / adafruit_icm20x.AccelRange.lsb[imu.accelerometer_range]
+    # Select user bank 0 once (REG_BANK_SEL)
+    with icm_i2c as dev:
+        dev.write(b"\x7F\x00")
+
+if icm is not None:
+    setup_accel_x(icm)
+
+def read_accel_x():
+    """Read X acceleration in m/s^2 with one I2C transaction"""
+    with icm_i2c as dev:
+        dev.write_then_readinto(ACCEL_XOUT_H, accel_buf)
+    raw = (accel_buf[0] << 8) | accel_buf[1]
+    if raw & 0x8000:
+        raw -= 65536
+    return raw * accel_scale
 
 # Create backlight pin (Active LOW)
 backlight = digitalio.DigitalInOut(microcontroller.pin.PA06)
@@ -69,8 +106,8 @@ tft_dc = board.D4
 
 backlight.value = False  # Active LOW - turns backlight ON
 
-WIDTH = 240
-HEIGHT = 135
+WIDTH = const(240)
+HEIGHT = const(135)
 
 display_bus = FourWire(spi, command=tft_dc, chip_select=tft_cs)
 display = ST7789(
@@ -82,33 +119,85 @@ button_jump = digitalio.DigitalInOut(board.D3)
 button_jump.direction = digitalio.Direction.INPUT
 button_jump.pull = digitalio.Pull.UP
 
-# Game constants
-GRAVITY = 1
-JUMP_STRENGTH = -12
-PLATFORM_HEIGHT = 4
+# Game constants (const() lets the compiler inline integer constants)
+GRAVITY = const(1)
+JUMP_STRENGTH = const(-12)
+PLATFORM_HEIGHT = const(4)
 
 # Sprite dimensions (adjust based on your BMP files)
-MARIO_WIDTH = 16
-MARIO_HEIGHT = 16
-DK_WIDTH = 32
-DK_HEIGHT = 32
-PRINCESS_WIDTH = 16
-PRINCESS_HEIGHT = 16
-BARREL_SIZE = 8
+MARIO_WIDTH = const(16)
+MARIO_HEIGHT = const(16)
+DK_WIDTH = const(32)
+DK_HEIGHT = const(32)
+PRINCESS_WIDTH = const(16)
+PRINCESS_HEIGHT = const(16)
+BARREL_SIZE = const(8)
+MAX_BARRELS = const(8)
 
 # IMU sensitivity (adjust these for better control)
 IMU_SENSITIVITY = 1.5  # How much tilt affects movement
 IMU_DEADZONE = 0.3     # Ignore small tilts
 
+# Player X is kept as a fixed-point int (1/16 pixel) so the fractional tilt
+# movement doesn't turn positions and collision math into floats
+FIX_SHIFT = const(4)
+FIX = const(1 << FIX_SHIFT)
+IMU_SENSITIVITY_FIX = IMU_SENSITIVITY * FIX
+
 # Colors
-COLOR_BLACK = 0x000000
-COLOR_WHITE = 0xFFFFFF
-COLOR_RED = 0xFF0000
-COLOR_BLUE = 0x0000FF
-COLOR_BROWN = 0x8B4513
-COLOR_YELLOW = 0xFFFF00
-COLOR_PINK = 0xFF69B4
-COLOR_GREEN = 0x00FF00
+COLOR_BLACK = const(0x000000)
+COLOR_WHITE = const(0xFFFFFF)
+COLOR_RED = const(0xFF0000)
+COLOR_BLUE = const(0x0000FF)
+COLOR_BROWN = const(0x8B4513)
+COLOR_YELLOW = const(0xFFFF00)
+COLOR_PINK = const(0xFF69B4)
+COLOR_GREEN = const(0x00FF00)
+
+# NeoPixel patterns (pixel 0 is always off), written with one slice assignment
+PATTERN_LEFT = (COLOR_BLACK, COLOR_BLUE, COLOR_BLUE, COLOR_BLACK, COLOR_BLACK)
+PATTERN_RIGHT = (COLOR_BLACK, COLOR_BLACK, COLOR_BLACK, COLOR_BLUE, COLOR_BLUE)
+PATTERN_CENTER = (COLOR_BLACK, COLOR_BLACK, COLOR_GREEN, COLOR_BLACK, COLOR_BLACK)
+TILT_PATTERNS = (PATTERN_LEFT, PATTERN_CENTER, PATTERN_RIGHT)  # indexed by tilt state 0/1/2
+SWEEP = [
+    (COLOR_BLACK, COLOR_RED, COLOR_BLACK, COLOR_BLACK, COLOR_BLACK),
+    (COLOR_BLACK, COLOR_BLACK, COLOR_RED, COLOR_BLACK, COLOR_BLACK),
+    (COLOR_BLACK, COLOR_BLACK, COLOR_BLACK, COLOR_RED, COLOR_BLACK),
+    (COLOR_BLACK, COLOR_BLACK, COLOR_BLACK, COLOR_BLACK, COLOR_RED),
+]
+
+def load_bmp(path):
+    """Load a BMP, reading uncompressed 8-bit files straight into a Bitmap
+    with bitmaptools.readinto and anything else with adafruit_imageload"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(54)
+            if header[0:2] != b"BM":
+                raise ValueError("not a BMP file")
+            data_offset, header_size, width, height = struct.unpack_from("<IIii", header, 10)
+            bits_per_pixel, compression = struct.unpack_from("<HI", header, 28)
+            colors = struct.unpack_from("<I", header, 46)[0] or 256
+            if bits_per_pixel != 8 or compression != 0:
+                raise ValueError("not an uncompressed 8-bit BMP")
+            
+            # Palette entries are stored as B, G, R, unused
+            palette = displayio.Palette(colors)
+            f.seek(14 + header_size)
+            entries = f.read(colors * 4)
+            for i in range(colors):
+                palette[i] = (entries[i*4 + 2] << 16) | (entries[i*4 + 1] << 8) | entries[i*4]
+            
+            # Rows are padded to 4 bytes (element_size=4) and stored bottom-up
+            # unless the height is negative
+            bitmap = displayio.Bitmap(width, abs(height), colors)
+            f.seek(data_offset)
+            bitmaptools.readinto(bitmap, f, bits_per_pixel=8, element_size=4,
+                                 reverse_rows=height > 0)
+            return bitmap, palette
+    except (OSError, ValueError) as e:
+        if Debug:
+            print(f"Fast BMP load of {path} failed ({e}), using adafruit_imageload")
+    return adafruit_imageload.load(path, bitmap=displayio.Bitmap, palette=displayio.Palette)
 
 # Load bitmap sprites
 if Debug:
@@ -116,11 +205,7 @@ if Debug:
 
 # Load splash screen
 try:
-    splash_bitmap, splash_palette = adafruit_imageload.load(
-        "/DK_splash.bmp",
-        bitmap=displayio.Bitmap,
-        palette=displayio.Palette
-    )
+    splash_bitmap, splash_palette = load_bmp("/DK_splash.bmp")
     print("Splash screen loaded")
 except Exception as e:
     print(f"Error loading DK_splash.bmp: {e}")
@@ -128,11 +213,7 @@ except Exception as e:
 
 try:
     # Load Mario sprite
-    mario_bitmap, mario_palette = adafruit_imageload.load(
-        "/mario.bmp",
-        bitmap=displayio.Bitmap,
-        palette=displayio.Palette
-    )
+    mario_bitmap, mario_palette = load_bmp("/mario.bmp")
     if Debug:
         print("Mario sprite loaded")
 except Exception as e:
@@ -141,11 +222,7 @@ except Exception as e:
 
 try:
     # Load Donkey Kong sprite
-    dk_bitmap, dk_palette = adafruit_imageload.load(
-        "/DK.bmp",
-        bitmap=displayio.Bitmap,
-        palette=displayio.Palette
-    )
+    dk_bitmap, dk_palette = load_bmp("/DK.bmp")
     if Debug:
         print("DK sprite loaded")
 except Exception as e:
@@ -154,68 +231,72 @@ except Exception as e:
 
 try:
     # Load Princess sprite
-    princess_bitmap, princess_palette = adafruit_imageload.load(
-        "/princess.bmp",
-        bitmap=displayio.Bitmap,
-        palette=displayio.Palette
-    )
+    princess_bitmap, princess_palette = load_bmp("/princess.bmp")
     if Debug:
         print("Princess sprite loaded")
 except Exception as e:
     print(f"Error loading princess.bmp: {e}")
     princess_bitmap = None
 
+def make_sprite(bitmap, palette, width, height, fallback, name):
+    """Create a TileGrid for a sprite bitmap, or the fallback shape if unavailable"""
+    if bitmap is not None:
+        try:
+            if bitmap.width == width and bitmap.height == height:
+                # Single sprite - no tiling needed
+                return displayio.TileGrid(bitmap, pixel_shader=palette)
+            # Try to create tiled sprite
+            return displayio.TileGrid(
+                bitmap,
+                pixel_shader=palette,
+                width=1,
+                height=1,
+                tile_width=width,
+                tile_height=height
+            )
+        except ValueError as e:
+            print(f"{name} sprite error: {e}, using fallback")
+    return fallback()
+
 class Player:
     def __init__(self, x, y, bitmap, palette):
-        self.x = x
+        self.x_fp = int(x * FIX)  # fixed-point X, self.x is whole pixels
+        self.x = int(x)
         self.y = y
         self.vel_y = 0
         self.is_jumping = False
         self.on_ground = False
         
         # Create sprite or fallback to circle
-        if bitmap is not None:
-            try:
-                # Check if bitmap dimensions match expected tile size
-                if bitmap.width == MARIO_WIDTH and bitmap.height == MARIO_HEIGHT:
-                    # Single sprite - no tiling needed
-                    self.sprite = displayio.TileGrid(
-                        bitmap,
-                        pixel_shader=palette
-                    )
-                else:
-                    # Try to create tiled sprite
-                    self.sprite = displayio.TileGrid(
-                        bitmap,
-                        pixel_shader=palette,
-                        width=1,
-                        height=1,
-                        tile_width=MARIO_WIDTH,
-                        tile_height=MARIO_HEIGHT
-                    )
-            except ValueError as e:
-                print(f"Mario sprite error: {e}, using fallback")
-                self.sprite = Circle(x, y, MARIO_WIDTH//2, fill=COLOR_RED)
-        else:
-            self.sprite = Circle(x, y, MARIO_WIDTH//2, fill=COLOR_RED)
-        
+        self.sprite = make_sprite(bitmap, palette, MARIO_WIDTH, MARIO_HEIGHT,
+                                  lambda: Circle(x, y, MARIO_WIDTH//2, fill=COLOR_RED), "Mario")
         self.sprite.x = int(x)
         self.sprite.y = int(y)
         
-    def update(self, platforms):
+    def update(self, platform_spans):
+        # Keep player on screen horizontally, then snap to whole pixels
+        if self.x_fp < 0:
+            self.x_fp = 0
+        if self.x_fp > (WIDTH - MARIO_WIDTH) * FIX:
+            self.x_fp = (WIDTH - MARIO_WIDTH) * FIX
+        self.x = self.x_fp >> FIX_SHIFT
+        
         # Apply gravity
         self.vel_y += GRAVITY
         self.y += self.vel_y
         
-        # Check platform collisions
+        # Check platform collisions (spans are (x, y, right) sorted by y, so
+        # stop at the first platform below the player's feet)
         self.on_ground = False
-        for platform in platforms:
-            if (self.x > platform['x'] and 
-                self.x < platform['x'] + platform['width'] and
-                self.y + MARIO_HEIGHT >= platform['y'] and
-                self.y + MARIO_HEIGHT <= platform['y'] + PLATFORM_HEIGHT + 5 and
+        for px, py, pright in platform_spans:
+            foot_y = self.y + MARIO_HEIGHT
+            if py > foot_y:
+                break
+            if (self.x > px and 
+                self.x < pright and
+                foot_y <= py + PLATFORM_HEIGHT + 5 and
                 self.vel_y >= 0):
-                self.y = platform['y'] - MARIO_HEIGHT
+                self.y = py - MARIO_HEIGHT
                 self.vel_y = 0
                 self.on_ground = True
                 self.is_jumping = False
@@ -227,23 +308,20 @@ class Player:
             self.on_ground = True
             self.is_jumping = False
             
-        if self.x < 0:
-            self.x = 0
-        if self.x > WIDTH - MARIO_WIDTH:
-            self.x = WIDTH - MARIO_WIDTH
-            
         # Update sprite position
-        self.sprite.x = int(self.x)
-        self.sprite.y = int(self.y)
+        self.sprite.x = self.x
+        self.sprite.y = self.y
     
-    def move_imu(self, accel_x):
+    def move_imu(self, accel_x, _deadzone=IMU_DEADZONE, _sensitivity=IMU_SENSITIVITY_FIX):
         """Move player based on IMU X acceleration"""
+        # Float constants can't be const(), so they are bound as default
+        # arguments to make them local lookups
         # Apply deadzone
-        if abs(accel_x) < IMU_DEADZONE:
+        if abs(accel_x) < _deadzone:
             return
             
         # Move player (positive - tilt right moves right, tilt left moves left)
-        self.x += accel_x * IMU_SENSITIVITY
+        self.x_fp += int(accel_x * _sensitivity)
         
     def jump(self):
         if self.on_ground and not self.is_jumping:
@@ -251,55 +329,84 @@ class Player:
             self.is_jumping = True
             self.on_ground = False
 
-class Barrel:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vel_x = 2
-        self.vel_y = 0
-        self.sprite = Circle(x, y, BARREL_SIZE//2, fill=COLOR_BROWN)
-        self.active = True
-        
-    def update(self, platforms):
-        # Move barrel
-        self.x += self.vel_x
-        self.vel_y += GRAVITY
-        self.y += self.vel_y
+class Barrels:
+    """All barrels in play, stored as parallel int16 ulab arrays (one slot per barrel)
+    so gravity, platform landings and player hits run as a few native array
+    ops per frame instead of a Python loop per barrel per platform"""
+    def __init__(self, max_barrels, group):
+        self.count = max_barrels
+        self.x = np.zeros(max_barrels, dtype=np.int16)
+        self.y = np.zeros(max_barrels, dtype=np.int16)
+        self.vel_x = np.zeros(max_barrels, dtype=np.int16)
+        self.vel_y = np.zeros(max_barrels, dtype=np.int16)
+        self.active = np.zeros(max_barrels, dtype=np.int16)  # 1 = in play, 0 = free slot
+        self.sprites = [Circle(0, 0, BARREL_SIZE//2, fill=COLOR_BROWN) for _ in range(max_barrels)]
+        # Add every sprite to the group once and show/hide them, so spawning
+        # and removing barrels never changes the group
+        for sprite in self.sprites:
+            sprite.hidden = True
+            group.append(sprite)
         
-        # Check platform collisions
-        for platform in platforms:
-            if (self.x > platform['x'] and 
-                self.x < platform['x'] + platform['width'] and
-                self.y + BARREL_SIZE//2 >= platform['y'] and
-                self.y + BARREL_SIZE//2 <= platform['y'] + PLATFORM_HEIGHT + 5 and
-                self.vel_y >= 0):
-                self.y = platform['y'] - BARREL_SIZE//2
-                self.vel_y = 0
+    def spawn(self, x, y):
+        # Use the first free slot (no new barrel if all slots are busy)
+        for i in range(self.count):
+            if not self.active[i]:
+                self.x[i] = x
+                self.y[i] = y
+                self.vel_x[i] = 2
+                self.vel_y[i] = 0
+                self.active[i] = 1
+                self.sprites[i].x = int(x)
+                self.sprites[i].y = int(y)
+                self.sprites[i].hidden = False
+                return
                 
-        # Remove if off screen
-        if self.x < -10 or self.x > WIDTH + 10 or self.y > HEIGHT + 10:
-            self.active = False
+    def remove(self, i):
+        self.active[i] = 0
+        self.vel_x[i] = 0
+        self.vel_y[i] = 0
+        self.sprites[i].hidden = True
             
-        # Update sprite
-        self.sprite.x = int(self.x)
-        self.sprite.y = int(self.y)
+    def clear(self):
+        for i in range(self.count):
+            if self.active[i]:
+                self.remove(i)
         
-    def collides_with(self, player):
-        # Check collision between barrel and player sprite
-        barrel_left = self.x - BARREL_SIZE//2
-        barrel_right = self.x + BARREL_SIZE//2
-        barrel_top = self.y - BARREL_SIZE//2
-        barrel_bottom = self.y + BARREL_SIZE//2
+    def update(self):
+        # Move barrels (free slots have no velocity and get no gravity)
+        self.x += self.vel_x
+        self.vel_y += GRAVITY * self.active
+        self.y += self.vel_y
         
-        player_left = player.x
-        player_right = player.x + MARIO_WIDTH
-        player_top = player.y
-        player_bottom = player.y + MARIO_HEIGHT
+        # Check platform collisions for every barrel against every platform
+        # at once: rows are barrels, columns are platforms
+        bx = self.x.reshape((self.count, 1))
+        bottom = (self.y + BARREL_SIZE//2).reshape((self.count, 1))
+        hit = ((bx > platform_x) & (bx < platform_right) &
+               (bottom >= platform_y) & (bottom <= platform_y + PLATFORM_HEIGHT + 5))
+        landing_y = np.max(hit * (platform_y - BARREL_SIZE//2), axis=1)
+        landed = (landing_y > 0) & (self.vel_y >= 0)
+        self.y = np.where(landed, landing_y, self.y)
+        self.vel_y = np.where(landed, 0, self.vel_y)
         
-        return (barrel_right > player_left and
-                barrel_left < player_right and
-                barrel_bottom > player_top and
-                barrel_top < player_bottom)
+        # Remove if off screen, otherwise update sprite
+        off_screen = (self.x < -10) | (self.x > WIDTH + 10) | (self.y > HEIGHT + 10)
+        for i in range(self.count):
+            if self.active[i]:
+                if off_screen[i]:
+                    self.remove(i)
+                else:
+                    self.sprites[i].x = int(self.x[i])
+                    self.sprites[i].y = int(self.y[i])
+        
+    def hits(self, player):
+        # Check collision between each barrel and player sprite
+        r = BARREL_SIZE//2
+        return ((self.active > 0) &
+                (self.x + r > player.x) &
+                (self.x - r < player.x + MARIO_WIDTH) &
+                (self.y + r > player.y) &
+                (self.y - r < player.y + MARIO_HEIGHT))
 
 class DonkeyKong:
     def __init__(self, x, y, bitmap, palette):
@@ -308,31 +415,8 @@ class DonkeyKong:
         self.barrel_timer = 0
         
         # Create sprite or fallback to rectangle
-        if bitmap is not None:
-            try:
-                # Check if bitmap dimensions match expected tile size
-                if bitmap.width == DK_WIDTH and bitmap.height == DK_HEIGHT:
-                    # Single sprite - no tiling needed
-                    self.sprite = displayio.TileGrid(
-                        bitmap,
-                        pixel_shader=palette
-                    )
-                else:
-                    # Try to create tiled sprite
-                    self.sprite = displayio.TileGrid(
-                        bitmap,
-                        pixel_shader=palette,
-                        width=1,
-                        height=1,
-                        tile_width=DK_WIDTH,
-                        tile_height=DK_HEIGHT
-                    )
-            except ValueError as e:
-                print(f"DK sprite error: {e}, using fallback")
-                self.sprite = Rect(x, y, DK_WIDTH, DK_HEIGHT, fill=COLOR_BROWN)
-        else:
-            self.sprite = Rect(x, y, DK_WIDTH, DK_HEIGHT, fill=COLOR_BROWN)
-        
+        self.sprite = make_sprite(bitmap, palette, DK_WIDTH, DK_HEIGHT,
+                                  lambda: Rect(x, y, DK_WIDTH, DK_HEIGHT, fill=COLOR_BROWN), "DK")
         self.sprite.x = int(x)
         self.sprite.y = int(y)
         
@@ -345,31 +429,8 @@ class Princess:
         self.y = y
         
         # Create sprite or fallback to circle
-        if bitmap is not None:
-            try:
-                # Check if bitmap dimensions match expected tile size
-                if bitmap.width == PRINCESS_WIDTH and bitmap.height == PRINCESS_HEIGHT:
-                    # Single sprite - no tiling needed
-                    self.sprite = displayio.TileGrid(
-                        bitmap,
-                        pixel_shader=palette
-                    )
-                else:
-                    # Try to create tiled sprite
-                    self.sprite = displayio.TileGrid(
-                        bitmap,
-                        pixel_shader=palette,
-                        width=1,
-                        height=1,
-                        tile_width=PRINCESS_WIDTH,
-                        tile_height=PRINCESS_HEIGHT
-                    )
-            except ValueError as e:
-                print(f"Princess sprite error: {e}, using fallback")
-                self.sprite = Circle(x, y, PRINCESS_WIDTH//2, fill=COLOR_PINK)
-        else:
-            self.sprite = Circle(x, y, PRINCESS_WIDTH//2, fill=COLOR_PINK)
-        
+        self.sprite = make_sprite(bitmap, palette, PRINCESS_WIDTH, PRINCESS_HEIGHT,
+                                  lambda: Circle(x, y, PRINCESS_WIDTH//2, fill=COLOR_PINK), "Princess")
         self.sprite.x = int(x)
         self.sprite.y = int(y)
 
@@ -378,23 +439,41 @@ game_group = displayio.Group()
 
 # Create platforms (from bottom to top)
 platforms = [
-    {'x': 0, 'y': HEIGHT - 10, 'width': WIDTH, 'rect': None},
-    {'x': 20, 'y': HEIGHT - 40, 'width': 180, 'rect': None},
-    {'x': 40, 'y': HEIGHT - 70, 'width': 180, 'rect': None},
-    {'x': 20, 'y': HEIGHT - 100, 'width': 180, 'rect': None},
-    {'x': 40, 'y': 20, 'width': 160, 'rect': None},
+    {'x': 0, 'y': HEIGHT - 10, 'width': WIDTH},
+    {'x': 20, 'y': HEIGHT - 40, 'width': 180},
+    {'x': 40, 'y': HEIGHT - 70, 'width': 180},
+    {'x': 20, 'y': HEIGHT - 100, 'width': 180},
+    {'x': 40, 'y': 20, 'width': 160},
 ]
 
-# Create platform rectangles
+# Draw all platforms into one shared bitmap so the display composes a single
+# TileGrid instead of one Rect per platform
+platforms_bitmap = displayio.Bitmap(WIDTH, HEIGHT, 2)
+platforms_palette = displayio.Palette(2)
+platforms_palette[0] = COLOR_BLACK
+platforms_palette[1] = COLOR_BLUE
+platforms_palette.make_transparent(0)
 for platform in platforms:
-    platform['rect'] = Rect(
-        platform['x'], 
-        platform['y'], 
-        platform['width'], 
-        PLATFORM_HEIGHT, 
-        fill=COLOR_BLUE
+    bitmaptools.fill_region(
+        platforms_bitmap,
+        platform['x'],
+        platform['y'],
+        platform['x'] + platform['width'],
+        platform['y'] + PLATFORM_HEIGHT,
+        1
     )
-    game_group.append(platform['rect'])
+game_group.append(displayio.TileGrid(platforms_bitmap, pixel_shader=platforms_palette))
+
+# Platform (x, y, right) tuples sorted top to bottom for the player collisions
+platform_spans = sorted(
+    [(platform['x'], platform['y'], platform['x'] + platform['width']) for platform in platforms],
+    key=lambda span: span[1]
+)
+
+# Platform extents as ulab arrays for the vectorized barrel collisions
+platform_x = np.array([platform['x'] for platform in platforms], dtype=np.int16)
+platform_right = np.array([platform['x'] + platform['width'] for platform in platforms], dtype=np.int16)
+platform_y = np.array([platform['y'] for platform in platforms], dtype=np.int16)
 
 # Create game objects with bitmap sprites
 player = Player(30, HEIGHT - MARIO_HEIGHT - 20, mario_bitmap, mario_palette if mario_bitmap else None)
@@ -406,13 +485,20 @@ game_group.append(donkey_kong.sprite)
 game_group.append(princess.sprite)
 game_group.append(player.sprite)
 
-# Barrel list
-barrels = []
+# Barrel slots
+barrels = Barrels(MAX_BARRELS, game_group)
+
+# Game state shared between the game tasks
+class GameState:
+    def __init__(self):
+        self.score = 0
+        self.lives = 3
+        self.game_over = False
+        self.accel_x = 0.0         # Latest IMU reading, written by imu_task
+        self.jump_pressed = False  # Latched by button_task, consumed by physics_task
+        self.flashing = False      # physics_task owns the NeoPixels during hit/victory flashes
 
-# Game state
-score = 0
-lives = 3
-game_over = False
+state = GameState()
 game_started = False  # Track if game has started
 
 # Create and show splash screen
@@ -445,9 +531,14 @@ print("=" * 40)
 pixel_animation = 0
 last_button_state = True
 
+# Bind the objects/methods used every pass to names once (saves attribute lookups)
+_bjump = button_jump
+_pshow = pixels.show
+_sleep = time.sleep
+
 # Wait for button press to start game
 while not game_started:
-    current_button = button_jump.value
+    current_button = _bjump.value
     
     # Check for button press (edge detection)
     if (last_button_state is True) and (current_button is False):
@@ -466,30 +557,10 @@ while not game_started:
     
     # Animate NeoPixels in a sweep pattern (skip pixel 0, use 1-4)
     pixel_animation = (pixel_animation + 1) % 40
-    pixels[0] = COLOR_BLACK  # Always keep first pixel off
-    if pixel_animation < 10:
-        pixels[1] = COLOR_RED
-        pixels[2] = COLOR_BLACK
-        pixels[3] = COLOR_BLACK
-        pixels[4] = COLOR_BLACK
-    elif pixel_animation < 20:
-        pixels[1] = COLOR_BLACK
-        pixels[2] = COLOR_RED
-        pixels[3] = COLOR_BLACK
-        pixels[4] = COLOR_BLACK
-    elif pixel_animation < 30:
-        pixels[1] = COLOR_BLACK
-        pixels[2] = COLOR_BLACK
-        pixels[3] = COLOR_RED
-        pixels[4] = COLOR_BLACK
-    else:
-        pixels[1] = COLOR_BLACK
-        pixels[2] = COLOR_BLACK
-        pixels[3] = COLOR_BLACK
-        pixels[4] = COLOR_RED
-    pixels.show()
+    pixels[0:5] = SWEEP[pixel_animation // 10]
+    _pshow()
     
-    time.sleep(0.05)
+    _sleep(0.05)
 
 # Game has started - switch to game screen
 display.root_group = game_group
@@ -498,146 +569,175 @@ print("Controls:")
 print("  Tilt board LEFT/RIGHT to move")
 print("  D3 button to JUMP")
 print("=" * 40)
-print(f"Lives: {lives}")
+print(f"Lives: {state.lives}")
 print("=" * 40)
 
-# Button state tracking for jump
-last_jump = True
-
-# Main game loop
-frame_count = 0
-while True:
-    frame_count += 1
-    
-    if not game_over:
-        # Read IMU acceleration
+# Princess never moves, so her center is fixed
+princess_center_x = princess.x + PRINCESS_WIDTH // 2
+princess_center_y = princess.y + PRINCESS_HEIGHT // 2
+
+# The game runs as cooperative tasks so the slow I2C IMU read, the button
+# poll, physics/display and NeoPixels each run at their own rate instead of
+# serializing every stage into one 50 FPS loop
+
+async def imu_task():
+    """Read the IMU at ~100Hz and publish the latest X acceleration"""
+    if icm is None:
+        return  # No IMU - the player just won't move
+    read = read_accel_x
+    sleep = asyncio.sleep
+    while not state.game_over:
+        # The IMU was found at startup, so the reads run without a try/except
+        # each time; an I2C error drops out of the inner loop and re-inits it
         try:
-            accel_x, accel_y, accel_z = icm.acceleration
-            
-            if Debug:
-                print(f"IMU X: {accel_x:.2f}, Y: {accel_y:.2f}, Z: {accel_z:.2f}")
-            
-            # Move player based on IMU tilt
-            player.move_imu(accel_x)
-            
-            # Visual feedback on NeoPixels based on tilt (skip pixel 0, use 1-4)
-            if accel_x < -IMU_DEADZONE:
-                # Tilting left - show blue on left side
-                pixels[0] = COLOR_BLACK  # Skip first pixel
-                pixels[1] = COLOR_BLUE
-                pixels[2] = COLOR_BLUE
-                pixels[3] = COLOR_BLACK
-                pixels[4] = COLOR_BLACK
-            elif accel_x > IMU_DEADZONE:
-                # Tilting right - show blue on right side
-                pixels[0] = COLOR_BLACK  # Skip first pixel
-                pixels[1] = COLOR_BLACK
-                pixels[2] = COLOR_BLACK
-                pixels[3] = COLOR_BLUE
-                pixels[4] = COLOR_BLUE
-            else:
-                # Center - show green
-                pixels[0] = COLOR_BLACK  # Skip first pixel
-                pixels[1] = COLOR_BLACK
-                pixels[2] = COLOR_GREEN
-                pixels[3] = COLOR_BLACK
-                pixels[4] = COLOR_BLACK
-            pixels.show()
-            
-        except Exception as e:
-            if Debug:
-                print(f"IMU read error: {e}")
-        
-        # Handle jump button (D3)
-        current_jump = button_jump.value
+            while not state.game_over:
+                state.accel_x = read()
+                
+                if Debug:
+                    print(f"IMU X: {state.accel_x:.2f}")
+                await sleep(0.01)
+        except OSError as e:
+            print(f"IMU read error: {e}, re-initializing")
+            state.accel_x = 0.0
+            try:
+                setup_accel_x(adafruit_icm20x.ICM20948(i2c, icm_address))
+            except (OSError, ValueError):
+                await sleep(0.5)  # try again shortly
+
+async def button_task():
+    """Poll the jump button (D3) and latch presses for physics_task"""
+    last_jump = True
+    jump_pin = button_jump
+    sleep = asyncio.sleep
+    while not state.game_over:
+        current_jump = jump_pin.value
         if (last_jump is True) and (current_jump is False):
-            player.jump()
+            state.jump_pressed = True
             if Debug:
                 print("Jump!")
         last_jump = current_jump
+        await sleep(0.005)
+
+async def physics_task():
+    """Move the player and barrels at ~50 FPS using the latest inputs"""
+    while not state.game_over:
+        # Move player based on IMU tilt
+        player.move_imu(state.accel_x)
+        
+        # Handle jump button (D3)
+        if state.jump_pressed:
+            state.jump_pressed = False
+            player.jump()
         
         # Update player
-        player.update(platforms)
+        player.update(platform_spans)
         
         # Spawn barrels from Donkey Kong
         donkey_kong.update()
         if donkey_kong.barrel_timer > 60:  # Every ~3 seconds
-            new_barrel = Barrel(donkey_kong.x + DK_WIDTH//2, donkey_kong.y + DK_HEIGHT)
-            barrels.append(new_barrel)
-            game_group.append(new_barrel.sprite)
+            barrels.spawn(donkey_kong.x + DK_WIDTH//2, donkey_kong.y + DK_HEIGHT)
             donkey_kong.barrel_timer = 0
         
         # Update barrels
-        for barrel in barrels[:]:
-            barrel.update(platforms)
-            
-            # Check collision with player
-            if barrel.collides_with(player):
-                lives -= 1
-                print(f"Hit! Lives remaining: {lives}")
-                barrel.active = False
+        barrels.update()
+        
+        # Check collision with player
+        hit = barrels.hits(player)
+        if np.any(hit):
+            for i in range(MAX_BARRELS):
+                if not hit[i]:
+                    continue
+                state.lives -= 1
+                print(f"Hit! Lives remaining: {state.lives}")
+                barrels.remove(i)
                 # Flash red on hit
+                state.flashing = True
                 pixels.fill(COLOR_RED)
                 pixels.show()
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
+                state.flashing = False
                 
-                if lives <= 0:
-                    game_over = True
+                if state.lives <= 0:
+                    state.game_over = True
                     print("=" * 40)
                     print("GAME OVER!")
-                    print(f"Final Score: {score}")
+                    print(f"Final Score: {state.score}")
                     print("=" * 40)
-            
-            # Remove inactive barrels
-            if not barrel.active:
-                try:
-                    game_group.remove(barrel.sprite)
-                except ValueError:
-                    pass
-                barrels.remove(barrel)
-        
-        # Check if player reached princess
-        player_center_x = player.x + MARIO_WIDTH // 2
-        player_center_y = player.y + MARIO_HEIGHT // 2
-        princess_center_x = princess.x + PRINCESS_WIDTH // 2
-        princess_center_y = princess.y + PRINCESS_HEIGHT // 2
+                    return
         
-        dist_to_princess = ((player_center_x - princess_center_x)**2 + 
-                           (player_center_y - princess_center_y)**2)**0.5
-        if dist_to_princess < 20:
-            score += 100
+        # Check if player reached princess (squared distance, no sqrt)
+        dx = player.x + MARIO_WIDTH // 2 - princess_center_x
+        dy = player.y + MARIO_HEIGHT // 2 - princess_center_y
+        if dx * dx + dy * dy < 400:  # within 20 pixels
+            state.score += 100
             print("=" * 40)
-            print(f"Level Complete! Score: {score}")
+            print(f"Level Complete! Score: {state.score}")
             print("=" * 40)
             
             # Victory flash
+            state.flashing = True
             for i in range(3):
                 pixels.fill(COLOR_YELLOW)
                 pixels.show()
-                time.sleep(0.1)
+                await asyncio.sleep(0.1)
                 pixels.fill(COLOR_GREEN)
                 pixels.show()
-                time.sleep(0.1)
+                await asyncio.sleep(0.1)
+            state.flashing = False
             
             # Reset player position
+            player.x_fp = 30 * FIX
             player.x = 30
             player.y = HEIGHT - MARIO_HEIGHT - 20
             player.vel_y = 0
             
             # Clear barrels
-            for barrel in barrels[:]:
-                try:
-                    game_group.remove(barrel.sprite)
-                except ValueError:
-                    pass
             barrels.clear()
-            
-    else:
-        # Game over - flash pixels
-        if (frame_count // 10) % 2 == 0:
-            pixels.fill(COLOR_RED)
+        
+        await asyncio.sleep(0.02)  # ~50 FPS
+
+async def neopixel_task():
+    """Show tilt feedback at ~20Hz, then flash red/yellow once the game is over"""
+    tick = 0
+    show = pixels.show
+    last_tilt_state = -1  # -1 = pixels don't currently show a tilt pattern
+    deadzone = IMU_DEADZONE
+    while True:
+        if state.game_over:
+            # Game over - flash pixels
+            if (tick // 4) % 2 == 0:
+                pixels.fill(COLOR_RED)
+            else:
+                pixels.fill(COLOR_YELLOW)
+            show()
+        elif state.flashing:
+            # A hit/victory flash overwrote the pixels
+            last_tilt_state = -1
         else:
-            pixels.fill(COLOR_YELLOW)
-        pixels.show()
-    
-    time.sleep(0.02)  # ~50 FPS
\ No newline at end of file
+            # Visual feedback on NeoPixels based on tilt (skip pixel 0, use 1-4):
+            # blue on the left, green in the center or blue on the right
+            accel_x = state.accel_x
+            if accel_x < -deadzone:
+                tilt_state = 0
+            elif accel_x > deadzone:
+                tilt_state = 2
+            else:
+                tilt_state = 1
+            # Only send to the NeoPixels when the pattern changes
+            if tilt_state != last_tilt_state:
+                pixels[0:5] = TILT_PATTERNS[tilt_state]
+                show()
+                last_tilt_state = tilt_state
+        tick += 1
+        await asyncio.sleep(0.05)
+
+async def main():
+    imu = asyncio.create_task(imu_task())
+    button = asyncio.create_task(button_task())
+    physics = asyncio.create_task(physics_task())
+    leds = asyncio.create_task(neopixel_task())
+
+    # gather starts the task loop - await is mandatory
+    await asyncio.gather(imu, button, physics, leds)
+
+asyncio.run(main())
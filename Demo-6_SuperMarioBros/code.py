@@ -14,6 +14,7 @@ Features:
 """
 
 import time
+import array
 import board
 import adafruit_icm20x
 import displayio
@@ -37,6 +38,13 @@ except ImportError:
     print("⚠ Audio libraries not available")
     AUDIO_AVAILABLE = False
 
+# ulab is optional, it only speeds up IMU calibration
+try:
+    from ulab import numpy as np
+    ULAB_AVAILABLE = True
+except ImportError:
+    ULAB_AVAILABLE = False
+
 # Display configuration
 DISPLAY_WIDTH = 240
 DISPLAY_HEIGHT = 135
@@ -47,12 +55,27 @@ JUMP_STRENGTH = -10
 MOVE_SPEED = 2.5
 RUN_SPEED = 4.5
 GROUND_Y = 105
+FRAME_NS = 1_000_000_000 // 30  # 30 FPS frame budget
+
+# Physics runs in Q8 fixed point (256 = 1 pixel) so the M4 does integer math;
+# x/y stay whole pixels for collisions and drawing
+Q8 = 256
+GRAVITY_Q8 = int(GRAVITY * Q8 + 0.5)
+JUMP_STRENGTH_Q8 = int(JUMP_STRENGTH * Q8)
+MOVE_SPEED_Q8 = int(MOVE_SPEED * Q8)
+RUN_SPEED_Q8 = int(RUN_SPEED * Q8)
+MAX_FALL_Q8 = 10 * Q8
 
 # IMU configuration
 TILT_DEADZONE = 0.8   # Minimum tilt to register (reduces drift)
 TILT_MAX = 6.0        # Maximum tilt for max speed
 CALIBRATION_SAMPLES = 30  # Number of samples for calibration
 
+# Memory: automatic GC is off during play, collect only below this much free RAM
+# or once this much has been allocated since the last collection
+GC_LOW_WATER = 16384
+GC_ALLOC_BUDGET = 2048
+
 # Sprite sizes
 MARIO_WIDTH = 16
 MARIO_HEIGHT = 16
@@ -60,6 +83,18 @@ ENEMY_WIDTH = 16
 ENEMY_HEIGHT = 16
 BLOCK_SIZE = 16
 
+# Platforms are bucketed by x for collision lookups (see Level.platform_buckets)
+BUCKET_SIZE = 32
+# Platforms and coins are bucketed by x for drawing (see Level.draw_buckets)
+DRAW_BUCKET_SIZE = 64
+
+# Tile offsets into /Sprites/sprite_atlas.bmp (see sprite_generator.py)
+MARIO_TILE = 0     # 3 frames
+GOOMBA_TILE = 3    # 2 frames
+BLOCK_TILE = 5     # brick, question, pipe
+BLOCK_TILES = {"brick": BLOCK_TILE, "question": BLOCK_TILE + 1, "pipe": BLOCK_TILE + 2}
+COIN_TILE = 16     # 8x16 tile index (coin is 8x14 at x=128)
+
 Debug = True
 
 class AudioManager:
@@ -67,11 +102,10 @@ class AudioManager:
     def __init__(self):
         self.audio_enabled = False
         self.audio = None
-        self.sounds = {}
-        self.current_file = None
-        self.current_wave = None  # Track wave object for cleanup
+        self.sounds = {}       # Sound name -> WaveFile, decoded once at startup
+        self.sound_files = {}  # Sound name -> open file backing its WaveFile
         self.last_play_time = 0  # Rate limiting
-        self.play_count = 0  # Track number of sounds played
+        self.play_cache = (0, False)  # (monotonic_ns, playing) from the last poll
         
         if not AUDIO_AVAILABLE:
             print("✗ Audio not available (missing libraries)")
@@ -91,7 +125,7 @@ class AudioManager:
             self.audio_enabled = False
     
     def load_sounds(self):
-        """Load WAV files from /AudioFiles/ directory"""
+        """Open each WAV in /AudioFiles/ once and keep its WaveFile for reuse"""
         sound_files = {
             'jump': '/AudioFiles/smb_jump.wav',
             'coin': '/AudioFiles/smb_coin.wav',
@@ -104,10 +138,11 @@ class AudioManager:
         print("Loading sound effects...")
         for sound_name, filepath in sound_files.items():
             try:
-                # Verify file exists
-                with open(filepath, "rb") as f:
-                    pass
-                self.sounds[sound_name] = filepath
+                # MEMORY: file and WaveFile stay open for the whole game, so
+                # playing a sound never allocates
+                wave_file = open(filepath, "rb")
+                self.sounds[sound_name] = audiocore.WaveFile(wave_file)
+                self.sound_files[sound_name] = wave_file
                 print(f"  ✓ {sound_name}: {filepath}")
             except Exception as e:
                 print(f"  ✗ {sound_name}: {e}")
@@ -118,41 +153,13 @@ class AudioManager:
             print("✗ No sound files found")
             self.audio_enabled = False
     
-    def cleanup_audio_resources(self):
-        """CRITICAL: Properly cleanup audio resources - FAST VERSION"""
-        try:
-            # Stop audio playback
-            if self.audio and self.audio.playing:
-                self.audio.stop()
-            
-            # Close file handle FIRST
-            if self.current_file is not None:
-                try:
-                    self.current_file.close()
-                except:
-                    pass
-                self.current_file = None
-            
-            # Delete wave object
-            if self.current_wave is not None:
-                del self.current_wave
-                self.current_wave = None
-            
-            # NO GC HERE - let main loop handle it!
-            
-        except Exception as e:
-            if Debug:
-                print(f"Cleanup error: {e}")
-            # Even on error, force cleanup
-            self.current_file = None
-            self.current_wave = None
-    
     def play(self, sound_name):
         """Play a sound effect - FAST VERSION, NO BLOCKING"""
         if not self.audio_enabled:
             return
             
-        if sound_name not in self.sounds:
+        wave = self.sounds.get(sound_name)
+        if wave is None:
             if Debug:
                 print(f"Sound '{sound_name}' not available")
             return
@@ -163,98 +170,65 @@ class AudioManager:
             return
         
         try:
-            # Clean up previous resources (fast, no GC)
-            self.cleanup_audio_resources()
-            
-            # Recreate audio device every 50 sounds
-            self.play_count += 1
-            if self.play_count % 50 == 0:
-                try:
-                    self.audio.deinit()
-                    self.audio = audioio.AudioOut(board.DAC)
-                except Exception as e:
-                    print(f"Audio reinit error: {e}")
-            
-            # Open and play immediately
-            filepath = self.sounds[sound_name]
-            self.current_file = open(filepath, "rb")
-            self.current_wave = audiocore.WaveFile(self.current_file)
-            self.audio.play(self.current_wave)
+            # Replaying a cached WaveFile restarts it from the beginning
+            if self.audio.playing:
+                self.audio.stop()
+            self.audio.play(wave)
             self.last_play_time = current_time
+            self.play_cache = (time.monotonic_ns(), True)
             
             if Debug:
                 print(f"♪ {sound_name}")
                 
         except Exception as e:
             print(f"Audio error ({sound_name}): {e}")
-            self.cleanup_audio_resources()
     
     def stop(self):
         """Stop current audio playback"""
         if self.audio_enabled and self.audio:
-            self.cleanup_audio_resources()
-            # NO GC - let main loop handle it
+            try:
+                if self.audio.playing:
+                    self.audio.stop()
+                self.play_cache = (time.monotonic_ns(), False)
+            except Exception as e:
+                if Debug:
+                    print(f"Audio stop error: {e}")
     
     def is_playing(self):
-        """Check if audio is currently playing"""
+        """Check if audio is currently playing (re-polled at most every 16ms)"""
         if self.audio_enabled and self.audio:
+            now = time.monotonic_ns()
+            polled_at, playing = self.play_cache
+            if now - polled_at < 16_000_000:
+                return playing
             try:
-                return self.audio.playing
+                playing = self.audio.playing
             except:
-                return False
+                playing = False
+            self.play_cache = (now, playing)
+            return playing
         return False
 
 class SpriteLoader:
-    """Load and manage sprite sheets"""
+    """Load and manage the sprite atlas"""
     def __init__(self):
         self.sprites_loaded = False
-        self.mario_sheet = None
-        self.mario_palette = None
-        self.goomba_sheet = None
-        self.goomba_palette = None
-        self.block_sheet = None
-        self.block_palette = None
-        self.coin_sheet = None
-        self.coin_palette = None
+        self.sheet = None
+        self.palette = None
         
         self.load_sprites()
         
     def load_sprites(self):
-        """Load all sprite sheets from /Sprites/ directory"""
+        """Load the sprite atlas from /Sprites/ directory"""
         try:
-            print("Loading sprite sheets...")
-            
-            # Load Mario sprites (48x16, 3 frames of 16x16)
-            self.mario_sheet, self.mario_palette = adafruit_imageload.load(
-                "/Sprites/mario_sprites.bmp",
-                bitmap=displayio.Bitmap,
-                palette=displayio.Palette
-            )
-            print("✓ Mario sprites loaded")
-            
-            # Load Goomba sprites (32x16, 2 frames of 16x16)
-            self.goomba_sheet, self.goomba_palette = adafruit_imageload.load(
-                "/Sprites/goomba_sprites.bmp",
-                bitmap=displayio.Bitmap,
-                palette=displayio.Palette
-            )
-            print("✓ Goomba sprites loaded")
-            
-            # Load block sprites (48x16, 3 types of 16x16)
-            self.block_sheet, self.block_palette = adafruit_imageload.load(
-                "/Sprites/block_sprites.bmp",
-                bitmap=displayio.Bitmap,
-                palette=displayio.Palette
-            )
-            print("✓ Block sprites loaded")
+            print("Loading sprite atlas...")
             
-            # Load coin sprite (8x14)
-            self.coin_sheet, self.coin_palette = adafruit_imageload.load(
-                "/Sprites/coin_sprite.bmp",
+            # One 144x16 sheet holds Mario, Goomba, block and coin tiles
+            self.sheet, self.palette = adafruit_imageload.load(
+                "/Sprites/sprite_atlas.bmp",
                 bitmap=displayio.Bitmap,
                 palette=displayio.Palette
             )
-            print("✓ Coin sprite loaded")
             
             self.sprites_loaded = True
             print("✓ All sprites loaded successfully!\n")
@@ -268,95 +242,120 @@ class Camera:
     """Camera system for side-scrolling"""
     def __init__(self):
         self.x = 0
+        self.x_q = 0  # Q8 position, x is its whole-pixel part
         self.target_x = 0
-        self.smoothing = 0.2
+        self.smoothing = 51  # 0.2 in Q8
+        self.last_mario_x = 0
         
     def update(self, mario_x):
         """Follow Mario smoothly"""
+        # Settled: Mario hasn't moved and we're within half a pixel of target
+        if mario_x == self.last_mario_x and -128 < (self.target_x << 8) - self.x_q < 128:
+            return
+        self.last_mario_x = mario_x
         self.target_x = mario_x - DISPLAY_WIDTH // 3
         self.target_x = max(0, min(self.target_x, 2200 - DISPLAY_WIDTH))
-        self.x += (self.target_x - self.x) * self.smoothing
-
-class Platform:
-    """Static platform"""
-    def __init__(self, x, y, width, height, block_type="brick"):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.block_type = block_type
-
-class Coin:
-    """Collectible coin"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.collected = False
+        self.x_q += ((self.target_x << 8) - self.x_q) * self.smoothing >> 8
+        self.x = self.x_q >> 8
 
 class Enemy:
     """Goomba enemy"""
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        self.x = int(x)
+        self.y = int(y)
+        self.x_q = self.x << 8  # Q8 position, x/y are its whole-pixel part
+        self.y_q = self.y << 8
         self.width = ENEMY_WIDTH
         self.height = ENEMY_HEIGHT
-        self.vel_x = -1.0
+        self.vel_x = -Q8  # Q8 velocities
         self.vel_y = 0
         self.alive = True
         self.on_ground = False
         self.sprite_frame = 0
         self.frame_counter = 0
         
-    def update(self, platforms):
+    def update(self, level, _gravity=GRAVITY_Q8, _bucket_size=BUCKET_SIZE,
+               _block_size=BLOCK_SIZE, _fall_limit=DISPLAY_HEIGHT + 50):
         """Update enemy movement - OPTIMIZED for performance"""
         if not self.alive:
             return False
             
-        self.x += self.vel_x
-        self.vel_y += GRAVITY
-        self.y += self.vel_y
+        self.x_q += self.vel_x
+        self.vel_y += _gravity
+        self.y_q += self.vel_y
+        self.x = self.x_q >> 8
+        self.y = self.y_q >> 8
         
-        # OPTIMIZATION: Only check platforms within reasonable range
-        # Enemies move slowly so we only need to check nearby platforms
-        nearby_range = 100  # Check platforms within 100 pixels
+        # OPTIMIZATION: Only check the platforms bucketed near our x
+        nearby = level.platform_buckets.get(self.x // _bucket_size, ())
+        px, pr, py, ph = level.px, level.pr, level.py, level.ph
         
         self.on_ground = False
-        for platform in platforms:
-            # CRITICAL: Skip platforms that are far away
-            if abs(platform.x - self.x) > nearby_range:
+        
+        # Hoist our own edges into locals for the loops below
+        left = self.x
+        right = left + self.width
+        height = self.height
+        bottom = self.y + height
+        
+        # The ground row isn't stored as platforms, so test it directly
+        ground_y = level.ground_y
+        landing = self.vel_y >= 0
+        if (landing and 0 < right and left < level.ground_end and
+            ground_y <= bottom <= ground_y + _block_size + 5):
+            self.y = ground_y - height
+            self.y_q = self.y << 8
+            self.vel_y = 0
+            self.on_ground = True
+            bottom = ground_y
+            landing = False
+        
+        # One pass over nearby platforms finds both the first one to land on
+        # and the first wall (a platform whose bottom is above our feet)
+        wall = -1
+        for i in nearby:
+            x = px[i]
+            if right <= x or left >= pr[i]:
                 continue
-                
-            if (self.x + self.width > platform.x and 
-                self.x < platform.x + platform.width and
-                self.vel_y >= 0 and
-                self.y + self.height >= platform.y and
-                self.y + self.height <= platform.y + platform.height + 5):
-                self.y = platform.y - self.height
+            y = py[i]
+            if landing and y <= bottom <= y + ph[i] + 5:
+                self.y = y - height
+                self.y_q = self.y << 8
                 self.vel_y = 0
                 self.on_ground = True
-                break  # Found ground, no need to check more
-                
-        # Check for wall collisions (only nearby platforms)
-        for platform in platforms:
-            if abs(platform.x - self.x) > nearby_range:
-                continue
-                
-            if (self.x + self.width > platform.x and 
-                self.x < platform.x + platform.width):
-                if self.y + self.height > platform.y + platform.height:
-                    if self.vel_x > 0:
-                        self.x = platform.x - self.width
-                    else:
-                        self.x = platform.x + platform.width
-                    self.vel_x *= -1
-                    break  # Hit wall, no need to check more
+                bottom = y
+                landing = False
+                if wall >= 0:
+                    break
+            elif wall < 0 and bottom > y + ph[i]:
+                wall = i
+                if not landing:
+                    break
+        
+        if wall >= 0 and bottom <= py[wall] + ph[wall]:
+            # Rare: landing after the wall was found raised our feet above
+            # it, so look for the first wall again from the final position
+            wall = -1
+            for i in nearby:
+                if right > px[i] and left < pr[i] and bottom > py[i] + ph[i]:
+                    wall = i
+                    break
+        
+        # Wall collision: turn around at the wall's edge
+        if wall >= 0:
+            if self.vel_x > 0:
+                self.x = px[wall] - self.width
+            else:
+                self.x = pr[wall]
+            self.x_q = self.x << 8
+            self.vel_x = -self.vel_x
         
         self.frame_counter += 1
         if self.frame_counter >= 15:
             self.sprite_frame = 1 - self.sprite_frame
             self.frame_counter = 0
         
-        if self.y > DISPLAY_HEIGHT + 50:
+        if self.y > _fall_limit:
             return True
             
         return False
@@ -365,65 +364,95 @@ class Enemy:
         """Enemy stomped"""
         self.alive = False
 
-def check_collision(x1, y1, w1, h1, x2, y2, w2, h2):
-    """AABB collision detection"""
-    return (x1 < x2 + w2 and x1 + w1 > x2 and
-            y1 < y2 + h2 and y1 + h1 > y2)
-
 class Level:
     """Game level with platforms, enemies, and coins"""
     def __init__(self):
-        self.platforms = []
+        # Platforms are stored as parallel arrays px, py, pw, ph and ptile
+        # (the block type already resolved to its atlas tile),
+        # plus pr (px + pw) since every overlap test wants the right edge
+        # (filled by create_level)
+        self.platform_buckets = {}
+        
+        # The brick ground row (x = 0 to 2208) isn't stored as platforms:
+        # Mario and enemies test it directly and draw() scrolls one tile strip
+        self.ground_y = GROUND_Y + 15
+        self.ground_end = 2208
         self.enemies = []
-        self.coins = []
+        # Coins are parallel arrays too: coin_x, coin_y and coin_collected
         self.create_level()
+        self.build_platform_buckets()
+        self.build_draw_buckets()
         
     def create_level(self):
         """Create a simple but fun level"""
-        for i in range(0, 2200, BLOCK_SIZE):
-            self.platforms.append(Platform(i, GROUND_Y + 15, BLOCK_SIZE, BLOCK_SIZE))
-        
-        for x in [200, 250, 300]:
-            self.platforms.append(Platform(x, 70, BLOCK_SIZE, BLOCK_SIZE, "question"))
-            
-        for x in range(400, 550, BLOCK_SIZE):
-            self.platforms.append(Platform(x, 80, BLOCK_SIZE, BLOCK_SIZE, "brick"))
-            
-        for x in range(700, 800, BLOCK_SIZE):
-            self.platforms.append(Platform(x, 60, BLOCK_SIZE, BLOCK_SIZE))
-            
-        self.platforms.append(Platform(900, 90, BLOCK_SIZE, BLOCK_SIZE*3, "pipe"))
-        
-        for x in range(1100, 1250, BLOCK_SIZE):
-            self.platforms.append(Platform(x, 70, BLOCK_SIZE, BLOCK_SIZE))
-            
-        for x in range(1400, 1550, BLOCK_SIZE):
-            y_offset = ((x - 1400) // BLOCK_SIZE) * BLOCK_SIZE
-            self.platforms.append(Platform(x, GROUND_Y - y_offset, BLOCK_SIZE, BLOCK_SIZE))
-            
-        for x in range(1700, 1900, BLOCK_SIZE):
-            self.platforms.append(Platform(x, 50, BLOCK_SIZE, BLOCK_SIZE, "brick"))
-            
-        self.platforms.append(Platform(2050, 70, BLOCK_SIZE, BLOCK_SIZE*2, "pipe"))
+        # Platforms as (x, y, width, height, type) tuples, packed into the
+        # arrays below and then dropped
+        platforms = (
+            [(x, 70, BLOCK_SIZE, BLOCK_SIZE, "question") for x in (200, 250, 300)] +
+            [(x, 80, BLOCK_SIZE, BLOCK_SIZE, "brick") for x in range(400, 550, BLOCK_SIZE)] +
+            [(x, 60, BLOCK_SIZE, BLOCK_SIZE, "brick") for x in range(700, 800, BLOCK_SIZE)] +
+            [(900, 90, BLOCK_SIZE, BLOCK_SIZE*3, "pipe")] +
+            [(x, 70, BLOCK_SIZE, BLOCK_SIZE, "brick") for x in range(1100, 1250, BLOCK_SIZE)] +
+            # Staircase, one block higher per step
+            [(x, GROUND_Y - (x - 1400), BLOCK_SIZE, BLOCK_SIZE, "brick")
+             for x in range(1400, 1550, BLOCK_SIZE)] +
+            [(x, 50, BLOCK_SIZE, BLOCK_SIZE, "brick") for x in range(1700, 1900, BLOCK_SIZE)] +
+            [(2050, 70, BLOCK_SIZE, BLOCK_SIZE*2, "pipe")]
+        )
+        platforms.sort()  # Left to right - draw() relies on this to stop early
+        self.px = array.array('h', [p[0] for p in platforms])
+        self.py = array.array('h', [p[1] for p in platforms])
+        self.pw = array.array('h', [p[2] for p in platforms])
+        self.pr = array.array('h', [p[0] + p[2] for p in platforms])
+        self.ph = array.array('h', [p[3] for p in platforms])
+        self.ptile = bytes([BLOCK_TILES[p[4]] for p in platforms])
         
         for x in [150, 350, 600, 950, 1200, 1500, 1800]:
             self.enemies.append(Enemy(x, GROUND_Y))
             
         # Coins - positioned to be accessible (not embedded in platforms)
-        for x in [225, 275, 475, 525]:
-            self.coins.append(Coin(x, 50))
-        # These coins were embedded in platforms, moved up to be accessible
-        self.coins.append(Coin(750, 30))   # Was y=50, overlapped with platform at y=60
-        self.coins.append(Coin(1175, 50))  # This one was fine
-        self.coins.append(Coin(1450, 30))  # Was y=50, overlapped with staircase at y=57
-        self.coins.append(Coin(1750, 30))  # Was y=50, overlapped with brick at y=50
+        coins = [(x, 50) for x in (225, 275, 475, 525)] + [
+            # These coins were embedded in platforms, moved up to be accessible
+            (750, 30),   # Was y=50, overlapped with platform at y=60
+            (1175, 50),  # This one was fine
+            (1450, 30),  # Was y=50, overlapped with staircase at y=57
+            (1750, 30),  # Was y=50, overlapped with brick at y=50
+        ]
+        coins.sort()
+        self.coin_x = array.array('h', [c[0] for c in coins])
+        self.coin_y = array.array('h', [c[1] for c in coins])
+        self.coin_collected = bytearray(len(coins))
+        
+    def build_platform_buckets(self):
+        """Index platforms by x // BUCKET_SIZE for collision lookups"""
+        # Each platform also goes into the neighbouring buckets, so a single
+        # lookup at an object's x finds every platform it can touch
+        buckets = self.platform_buckets
+        for i, x in enumerate(self.px):
+            b = x // BUCKET_SIZE
+            for key in (b - 1, b, b + 1):
+                if key in buckets:
+                    buckets[key].append(i)
+                else:
+                    buckets[key] = [i]
+    
+    def build_draw_buckets(self):
+        """Index platforms and coins by x // DRAW_BUCKET_SIZE for culling"""
+        # Unlike platform_buckets each object is in exactly one bucket, so
+        # draw() never places the same one twice. Objects are sorted by x, so
+        # each bucket lists them left to right.
+        self.draw_buckets = {}
+        for i, x in enumerate(self.px):
+            self.draw_buckets.setdefault(x // DRAW_BUCKET_SIZE, []).append(i)
+        self.coin_buckets = {}
+        for i, x in enumerate(self.coin_x):
+            self.coin_buckets.setdefault(x // DRAW_BUCKET_SIZE, []).append(i)
 
 class Mario:
     """Mario with enhanced IMU physics and sprite animation - ORIGINAL CODE"""
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vel_x = 0
+        self.place(x, y)
+        self.vel_x = 0  # Q8 velocities
         self.vel_y = 0
         self.on_ground = False
         self.facing_right = True
@@ -435,7 +464,16 @@ class Mario:
         self.anim_counter = 0  # Animation timing
         self.jump_triggered = False  # Track when jump starts (for NeoPixel)
         
-    def update(self, imu_control, platforms):
+    def place(self, x, y):
+        """Move Mario to pixel position (x, y)"""
+        self.x = x
+        self.y = y
+        self.x_q = x << 8  # Q8 position, x/y are its whole-pixel part
+        self.y_q = y << 8
+        
+    def update(self, imu_control, level, _gravity=GRAVITY_Q8, _jump_strength=JUMP_STRENGTH_Q8,
+               _move_speed=MOVE_SPEED_Q8, _run_speed=RUN_SPEED_Q8, _ground_y=GROUND_Y,
+               _bucket_size=BUCKET_SIZE, _max_fall=MAX_FALL_Q8):
         """Update with IMU control and platform collision - OPTIMIZED"""
         prev_y = self.y
         
@@ -445,9 +483,9 @@ class Mario:
         
         # Movement with variable speed based on tilt amount
         if imu_control.tilt_value != 0:
-            move_speed = RUN_SPEED if imu_control.run else MOVE_SPEED
+            move_speed = _run_speed if imu_control.run else _move_speed
             # Use tilt value to control speed smoothly
-            self.vel_x = imu_control.tilt_value * move_speed
+            self.vel_x = int(imu_control.tilt_value * move_speed)
             self.facing_right = imu_control.tilt_value > 0
             
             # Walking animation
@@ -457,15 +495,16 @@ class Mario:
                     self.sprite_frame = 1 if self.sprite_frame == 0 else 0
                     self.anim_counter = 0
         else:
-            # Deceleration
-            self.vel_x *= 0.8
-            if abs(self.vel_x) < 0.1:
-                self.vel_x = 0
+            # Deceleration: 0.8 in Q8, stop below 0.1 px/frame
+            vel_x = self.vel_x * 205 >> 8
+            if -26 < vel_x < 26:
+                vel_x = 0
+            self.vel_x = vel_x
             self.sprite_frame = 0  # Standing
                 
         # Jumping
         if imu_control.jump and self.on_ground:
-            self.vel_y = JUMP_STRENGTH
+            self.vel_y = _jump_strength
             self.jump_triggered = True  # NeoPixel indicator
             self.on_ground = False
             
@@ -475,55 +514,66 @@ class Mario:
             
         # Gravity
         if not self.on_ground:
-            self.vel_y += GRAVITY
-            if self.vel_y > 10:
-                self.vel_y = 10
+            self.vel_y += _gravity
+            if self.vel_y > _max_fall:
+                self.vel_y = _max_fall
                 
         # Update position
-        self.x += self.vel_x
-        self.y += self.vel_y
+        self.x_q += self.vel_x
+        self.y_q += self.vel_y
+        self.x = self.x_q >> 8
+        # Round y up so any sinking into a platform counts as touching it
+        self.y = (self.y_q + 255) >> 8
         
-        # OPTIMIZED: Platform collision - only check nearby platforms
+        # OPTIMIZED: Platform collision - only check the platforms bucketed near Mario
         self.on_ground = False
-        nearby_range = 150  # Check platforms within 150 pixels (Mario moves faster than enemies)
         
-        for platform in platforms:
-            # CRITICAL: Skip platforms that are too far away
-            if abs(platform.x - self.x) > nearby_range and abs(platform.y - self.y) > nearby_range:
-                continue
-                
-            if self.check_platform_collision(platform, prev_y):
-                break
+        # Ground row first (it isn't stored as platforms), then nearby platforms
+        ground_y = level.ground_y
+        if (self.vel_y > 0 and
+            -self.width < self.x < level.ground_end and
+            prev_y + self.height <= ground_y < self.y + self.height):
+            self.y = ground_y - self.height
+            self.y_q = self.y << 8
+            self.vel_y = 0
+            self.on_ground = True
+            self.jump_triggered = False
+        else:
+            # AABB test inlined - a method call per platform is the
+            # expensive part of this loop on the M4
+            px, pr, py, ph = level.px, level.pr, level.py, level.ph
+            left = self.x
+            right = left + self.width
+            top = self.y
+            height = self.height
+            bottom = top + height
+            for i in level.platform_buckets.get(left // _bucket_size, ()):
+                x = px[i]
+                y = py[i]
+                h = ph[i]
+                if right > x and left < pr[i] and bottom > y and top < y + h:
+                    # Landing on top
+                    if prev_y + height <= y and self.vel_y > 0:
+                        self.y = y - height
+                        self.y_q = self.y << 8
+                        self.vel_y = 0
+                        self.on_ground = True
+                        self.jump_triggered = False  # Turn off NeoPixel when landing on platform
+                        break
+                    # Hitting from below
+                    elif prev_y >= y + h and self.vel_y < 0:
+                        self.y = y + h
+                        self.y_q = self.y << 8
+                        self.vel_y = 0
+                        break
                 
         # Ground collision
-        if self.y >= GROUND_Y:
-            self.y = GROUND_Y
+        if self.y >= _ground_y:
+            self.y = _ground_y
+            self.y_q = _ground_y << 8
             self.vel_y = 0
             self.on_ground = True
             self.jump_triggered = False  # Turn off NeoPixel when landing
-            
-    def check_platform_collision(self, platform, prev_y):
-        """Check collision with platform"""
-        if (self.x + self.width > platform.x and
-            self.x < platform.x + platform.width and
-            self.y + self.height > platform.y and
-            self.y < platform.y + platform.height):
-            
-            # Landing on top
-            if prev_y + self.height <= platform.y and self.vel_y > 0:
-                self.y = platform.y - self.height
-                self.vel_y = 0
-                self.on_ground = True
-                self.jump_triggered = False  # Turn off NeoPixel when landing on platform
-                return True
-                
-            # Hitting from below
-            elif prev_y >= platform.y + platform.height and self.vel_y < 0:
-                self.y = platform.y + platform.height
-                self.vel_y = 0
-                return True
-                
-        return False
 
 class IMUController:
     """Enhanced IMU controller with calibration - ORIGINAL CODE"""
@@ -553,9 +603,8 @@ class IMUController:
         self.btn_jump = digitalio.DigitalInOut(board.D3)
         self.btn_jump.direction = digitalio.Direction.INPUT
         self.btn_jump.pull = digitalio.Pull.UP
-        self.prev_jump = True
-        self.jump_buffer = False  # NEW: Buffer to catch quick presses
-        self.jump_buffer_frames = 0  # NEW: How long to keep buffered jump
+        self.btn_hist = 1  # Button history, newest sample in bit 0 (starts "held")
+        self.jump_frames = 0  # Buffered press, counts down once per update
         
         # Setup capacitive touch for run
         try:
@@ -580,85 +629,78 @@ class IMUController:
         """Calibrate IMU by averaging readings when level"""
         print("\nCalibrating IMU...")
         print("Place board on level surface...")
-        time.sleep(1)
+        time.sleep(0.5)  # Let the board settle once
         
-        sum_x, sum_y, sum_z = 0.0, 0.0, 0.0
+        icm = self.icm
         
-        for i in range(CALIBRATION_SAMPLES):
-            x, y, z = self.icm.acceleration
-            sum_x += x
-            sum_y += y
-            sum_z += z
-            time.sleep(0.05)
+        if ULAB_AVAILABLE:
+            # Collect the samples into one array and average them in C
+            samples = np.zeros((CALIBRATION_SAMPLES, 3))
+            for i in range(CALIBRATION_SAMPLES):
+                samples[i, :] = np.array(icm.acceleration)
+                time.sleep(0.01)
+            
+            offsets = np.mean(samples, axis=0)
+            self.offset_x = float(offsets[0])
+            self.offset_y = float(offsets[1])
+            self.offset_z = float(offsets[2])
+        else:
+            sum_x, sum_y, sum_z = 0.0, 0.0, 0.0
             
-        self.offset_x = sum_x / CALIBRATION_SAMPLES
-        self.offset_y = sum_y / CALIBRATION_SAMPLES
-        self.offset_z = sum_z / CALIBRATION_SAMPLES
+            for _ in range(CALIBRATION_SAMPLES):
+                a = icm.acceleration
+                sum_x += a[0]
+                sum_y += a[1]
+                sum_z += a[2]
+                time.sleep(0.01)
+                
+            self.offset_x = sum_x / CALIBRATION_SAMPLES
+            self.offset_y = sum_y / CALIBRATION_SAMPLES
+            self.offset_z = sum_z / CALIBRATION_SAMPLES
         
         print(f"✓ Calibration complete!")
         print(f"  Offsets: X={self.offset_x:.2f}, Y={self.offset_y:.2f}, Z={self.offset_z:.2f}")
         
     def update(self):
         """Read IMU and button states - WITH BUTTON BUFFERING"""
-        # Read accelerometer with calibration
-        accel_x, accel_y, accel_z = self.icm.acceleration
-        
-        # Apply calibration
-        adjusted_x = accel_x - self.offset_x
+        # Read accelerometer X (only axis used) and apply calibration
+        adjusted_x = self.icm.acceleration[0] - self.offset_x
         
-        # Apply deadzone
-        if abs(adjusted_x) < TILT_DEADZONE:
-            self.tilt_value = 0.0
-            self.left = False
-            self.right = False
+        # Apply deadzone, then remove its offset and normalize the magnitude
+        magnitude = abs(adjusted_x) - TILT_DEADZONE
+        if magnitude < 0:
+            tilt = 0.0
         else:
-            # Remove deadzone offset and normalize
-            if adjusted_x > 0:
-                self.tilt_value = min(1.0, (adjusted_x - TILT_DEADZONE) / TILT_MAX)
-                self.right = True
-                self.left = False
-            else:
-                self.tilt_value = max(-1.0, (adjusted_x + TILT_DEADZONE) / TILT_MAX)
-                self.left = True
-                self.right = False
+            tilt = min(1.0, magnitude / TILT_MAX)
+            if adjusted_x < 0:
+                tilt = -tilt
         
         # IMPROVED: Read jump button with buffering to catch quick presses
-        current_jump = not self.btn_jump.value
-        
-        # Detect button press (rising edge)
-        if current_jump and not self.prev_jump:
-            self.jump_buffer = True
-            self.jump_buffer_frames = 3  # Keep buffered for 3 frames (~100ms)
-        
-        self.prev_jump = current_jump
-        
-        # Set jump flag if buffer is active
-        if self.jump_buffer:
-            self.jump = True
-            self.jump_buffer_frames -= 1
-            # Clear buffer after it expires
-            if self.jump_buffer_frames <= 0:
-                self.jump_buffer = False
-                self.jump = False
-        else:
-            self.jump = False
+        self.poll_button_only()
+        frames = self.jump_frames
+        
+        # Jump while the buffer hasn't run out
+        if frames > 0:
+            frames -= 1
+        
+        self.tilt_value = tilt
+        self.right = tilt > 0
+        self.left = tilt < 0
+        self.jump_frames = frames
+        self.jump = frames > 0
         
         # Read capacitive touch
-        if self.touch_available:
-            self.run = self.touch_run.value
-        else:
-            self.run = False
+        self.run = self.touch_available and self.touch_run.value
     
     def poll_button_only(self):
         """Quick poll of just the button - call this frequently to catch fast presses"""
-        current_jump = not self.btn_jump.value
+        # Shift the new sample (1 = pressed) into the history
+        hist = ((self.btn_hist << 1) | (not self.btn_jump.value)) & 0xFF
+        self.btn_hist = hist
         
-        # Detect button press and buffer it
-        if current_jump and not self.prev_jump:
-            self.jump_buffer = True
-            self.jump_buffer_frames = 3
-        
-        self.prev_jump = current_jump
+        # Rising edge (released, then pressed) buffers a jump for 3 frames (~100ms)
+        if hist & 3 == 1:
+            self.jump_frames = 3
 
 class NeoPixelFeedback:
     """NeoPixel game feedback - ORIGINAL CODE"""
@@ -670,12 +712,21 @@ class NeoPixelFeedback:
             self.available = True
         except:
             self.available = False
+        
+        # Last (lives, jump, run, level_complete) shown - show() is slow, so
+        # the strip is only rewritten when this changes
+        self.last_state = None
             
     def update(self, mario, score, lives, level_complete=False):
         """Update based on game state"""
         if not self.available:
             return
         
+        state = (lives, mario.jump_triggered, mario.is_running, level_complete)
+        if state == self.last_state:
+            return
+        self.last_state = state
+        
         # Victory pattern - all gold!
         if level_complete:
             self.pixels.fill(0xFFD700)  # Gold color for victory!
@@ -696,16 +747,27 @@ class NeoPixelFeedback:
         
         self.pixels.show()
 
+def write_digits(buf, n, width):
+    """Write n as zero-padded decimal into the last width bytes of buf"""
+    for i in range(len(buf) - 1, len(buf) - 1 - width, -1):
+        buf[i] = 0x30 + n % 10
+        n //= 10
+
 class HUD:
     """Heads-Up Display for score, coins, and lives - ORIGINAL CODE"""
     def __init__(self, parent_group):
         self.hud_group = displayio.Group()
         parent_group.append(self.hud_group)
         
+        # MEMORY: Fixed-width text buffers, digits are rewritten in place
+        self.score_buf = bytearray(b"SCORE:00000")
+        self.lives_buf = bytearray(b"LIVES:3")
+        self.coins_buf = bytearray(b"COINS:00")
+        
         # Score label (top left)
         self.score_label = label.Label(
             terminalio.FONT,
-            text="SCORE: 0",
+            text=str(self.score_buf, "ascii"),
             color=0xFFFFFF,
             x=5,
             y=8
@@ -715,7 +777,7 @@ class HUD:
         # Lives label (top center)
         self.lives_label = label.Label(
             terminalio.FONT,
-            text="LIVES: 3",
+            text=str(self.lives_buf, "ascii"),
             color=0xFFFFFF,
             x=95,
             y=8
@@ -725,7 +787,7 @@ class HUD:
         # Coins label (top right)
         self.coins_label = label.Label(
             terminalio.FONT,
-            text="COINS: 0",
+            text=str(self.coins_buf, "ascii"),
             color=0xFFFFFF,
             x=175,
             y=8
@@ -743,15 +805,18 @@ class HUD:
         """Update HUD text - ONLY when values change (MEMORY OPTIMIZED)"""
         # Only update if values actually changed - prevents creating new strings every frame!
         if score != self.last_score:
-            self.score_label.text = f"SCORE:{score}"
+            write_digits(self.score_buf, score, 5)
+            self.score_label.text = str(self.score_buf, "ascii")
             self.last_score = score
         
         if coins != self.last_coins:
-            self.coins_label.text = f"COINS:{coins}"
+            write_digits(self.coins_buf, coins, 2)
+            self.coins_label.text = str(self.coins_buf, "ascii")
             self.last_coins = coins
         
         if lives != self.last_lives:
-            self.lives_label.text = f"LIVES:{lives}"
+            write_digits(self.lives_buf, lives, 1)
+            self.lives_label.text = str(self.lives_buf, "ascii")
             self.last_lives = lives
     
     def hide(self):
@@ -878,17 +943,22 @@ class GameOverScreen:
     def show(self):
         """Show game over screen"""
         self.gameover_group.hidden = False
+        gc.enable()  # Gameplay is over, automatic GC is safe again
     
     def hide(self):
         """Hide game over screen"""
         self.gameover_group.hidden = True
 
+def hide_unused(sprites, group, used, shown):
+    """Hide pool sprites used..shown-1 (shown last frame, unused this frame)
+    and hide the pool's whole group while none of it is in use"""
+    for i in range(used, shown):
+        sprites[i].hidden = True
+    if (used == 0) != (shown == 0):
+        group.hidden = used == 0
+
 class MarioGame:
     """Main game class"""
-    
-    # Class-level constants to avoid recreation
-    TILE_MAP = {"brick": 0, "question": 1, "pipe": 2}
-    
     def __init__(self):
         # MEMORY: Force garbage collection at start
         gc.collect()
@@ -917,6 +987,7 @@ class MarioGame:
         self.score = 0
         self.coins = 0
         self.lives = 3
+        self.hud_dirty = True  # Score, coins or lives changed since the HUD was drawn
         self.game_over = False
         self.level_complete = False
         self.victory_timer = 0
@@ -960,76 +1031,77 @@ class MarioGame:
         
     def create_sprite(self, w, h, color):
         """Create sprite for fallback when sprite files aren't loaded"""
-        bmp = displayio.Bitmap(w, h, 1)
-        pal = displayio.Palette(1)
-        pal[0] = color
-        return displayio.TileGrid(bmp, pixel_shader=pal)
+        # MEMORY: like the atlas, every fallback sprite of one size and
+        # color shares a single bitmap and palette
+        key = (w, h, color)
+        shared = self.fallback_shaders.get(key)
+        if shared is None:
+            bmp = displayio.Bitmap(w, h, 1)
+            pal = displayio.Palette(1)
+            pal[0] = color
+            shared = self.fallback_shaders[key] = (bmp, pal)
+        return displayio.TileGrid(shared[0], pixel_shader=shared[1])
         
     def setup_sprite_pools(self):
         """Create reusable sprite pools - UPDATED from original"""
         self.sprite_group = displayio.Group()
         self.main_group.append(self.sprite_group)
+        self.fallback_shaders = {}
         
         # Create sprite pools
         self.platform_sprites = []
         self.enemy_sprites = []
         self.coin_sprites = []
         
-        # Platform pool (increased to 75 to handle densest sections)
-        for i in range(75):
-            if self.sprite_loader.sprites_loaded:
-                sprite = displayio.TileGrid(
-                    self.sprite_loader.block_sheet,
-                    pixel_shader=self.sprite_loader.block_palette,
-                    width=1, height=1,
-                    tile_width=BLOCK_SIZE, tile_height=BLOCK_SIZE,
-                    x=0, y=0
-                )
-            else:
-                sprite = self.create_sprite(BLOCK_SIZE, BLOCK_SIZE, 0xD87850)
-            sprite.hidden = True
-            self.platform_sprites.append(sprite)
-            self.sprite_group.append(sprite)
-        
-        # Enemy pool (10 enemies)
-        for i in range(10):
-            if self.sprite_loader.sprites_loaded:
-                sprite = displayio.TileGrid(
-                    self.sprite_loader.goomba_sheet,
-                    pixel_shader=self.sprite_loader.goomba_palette,
-                    width=1, height=1,
-                    tile_width=ENEMY_WIDTH, tile_height=ENEMY_HEIGHT,
-                    x=0, y=0
-                )
-            else:
-                sprite = self.create_sprite(ENEMY_WIDTH, ENEMY_HEIGHT, 0x8B4513)
-            sprite.hidden = True
-            self.enemy_sprites.append(sprite)
-            self.sprite_group.append(sprite)
-            
-        # Coin pool (20 coins)
-        for i in range(20):
-            if self.sprite_loader.sprites_loaded:
-                sprite = displayio.TileGrid(
-                    self.sprite_loader.coin_sheet,
-                    pixel_shader=self.sprite_loader.coin_palette,
-                    width=1, height=1,
-                    tile_width=8, tile_height=14,
-                    x=0, y=0
-                )
-            else:
-                sprite = self.create_sprite(8, 14, 0xFCBC00)
-            sprite.hidden = True
-            self.coin_sprites.append(sprite)
-            self.sprite_group.append(sprite)
+        # Ground row: one strip of brick tiles that draw() scrolls with the camera
+        if self.sprite_loader.sprites_loaded:
+            self.ground_sprite = displayio.TileGrid(
+                self.sprite_loader.sheet,
+                pixel_shader=self.sprite_loader.palette,
+                width=DISPLAY_WIDTH // BLOCK_SIZE + 2, height=1,
+                tile_width=BLOCK_SIZE, tile_height=BLOCK_SIZE,
+                default_tile=BLOCK_TILE,
+                x=0, y=GROUND_Y + 15
+            )
+        else:
+            self.ground_sprite = self.create_sprite(DISPLAY_WIDTH + 2 * BLOCK_SIZE, BLOCK_SIZE, 0xD87850)
+            self.ground_sprite.y = GROUND_Y + 15
+        self.sprite_group.append(self.ground_sprite)
+        
+        # Each pool gets its own child group, so draw() can hide a whole
+        # category at once and displayio skips it
+        self.platforms_group = displayio.Group()
+        self.enemies_group = displayio.Group()
+        self.coins_group = displayio.Group()
+        
+        # Platform, enemy and coin pools all come from the atlas - one loop over
+        # (pool, group, size, tile w/h, default tile, fallback w/h, fallback color)
+        pools = (
+            # Platforms: at most 16 are ever in the visible window, draw()
+            # grows the pool if a level needs more
+            (self.platform_sprites, self.platforms_group, 24, BLOCK_SIZE, BLOCK_SIZE,
+             BLOCK_TILE, BLOCK_SIZE, BLOCK_SIZE, 0xD87850),
+            (self.enemy_sprites, self.enemies_group, 10, ENEMY_WIDTH, ENEMY_HEIGHT,
+             GOOMBA_TILE, ENEMY_WIDTH, ENEMY_HEIGHT, 0x8B4513),
+            (self.coin_sprites, self.coins_group, 20, 8, 16,
+             COIN_TILE, 8, 14, 0xFCBC00),
+        )
+        for pool, group, count, tile_w, tile_h, tile, fallback_w, fallback_h, color in pools:
+            group.hidden = True  # Nothing in use yet
+            self.sprite_group.append(group)
+            for i in range(count):
+                sprite = self.create_pool_sprite(tile_w, tile_h, tile, fallback_w, fallback_h, color)
+                pool.append(sprite)
+                group.append(sprite)
             
         # Mario sprite (always visible)
         if self.sprite_loader.sprites_loaded:
             self.mario_sprite = displayio.TileGrid(
-                self.sprite_loader.mario_sheet,
-                pixel_shader=self.sprite_loader.mario_palette,
+                self.sprite_loader.sheet,
+                pixel_shader=self.sprite_loader.palette,
                 width=1, height=1,
                 tile_width=MARIO_WIDTH, tile_height=MARIO_HEIGHT,
+                default_tile=MARIO_TILE,
                 x=40, y=GROUND_Y
             )
         else:
@@ -1037,8 +1109,14 @@ class MarioGame:
         self.sprite_group.append(self.mario_sprite)
         
         # OPTIMIZATION: Track last sprite state to avoid unnecessary updates
-        self.last_mario_frame = -1
-        self.last_mario_flip = None
+        # Mario's sprite as last drawn: frame, flip, x, y, hidden (-32768 = never)
+        self.mario_drawn = array.array('h', (-1, -1, -32768, -32768, 0))
+        self.platform_tiles = [-1] * len(self.platform_sprites)  # Tile shown per pool slot
+        self.enemy_tiles = [-1] * len(self.enemy_sprites)
+        # Pools fill from slot 0, so slots below these counts are the visible ones
+        self.platforms_shown = 0
+        self.coins_shown = 0
+        self.enemies_shown = 0
         
         print(f"✓ Sprite pools created: {len(self.platform_sprites)} platforms, {len(self.enemy_sprites)} enemies, {len(self.coin_sprites)} coins")
         
@@ -1060,10 +1138,8 @@ class MarioGame:
                 self.reset_level()
             return  # Don't update game during victory screen
             
-        # CRITICAL: Poll button at START of frame to catch quick presses
-        self.imu_control.poll_button_only()
-        
-        # Controls - UPDATE IMU (includes another button poll)
+        # Controls - UPDATE IMU (the frame's one button poll; the frame pacer
+        # in run() polls between frames to catch quick presses)
         self.imu_control.update()
         self.mario.is_running = self.imu_control.run
         
@@ -1071,7 +1147,7 @@ class MarioGame:
         mario_was_on_ground = self.mario.on_ground
         
         # Mario
-        self.mario.update(self.imu_control, self.level.platforms)
+        self.mario.update(self.imu_control, self.level)
         
         # Play jump sound if Mario just jumped
         if mario_was_on_ground and not self.mario.on_ground and self.mario.vel_y < 0:
@@ -1080,43 +1156,70 @@ class MarioGame:
         # Camera
         self.camera.update(self.mario.x)
         
-        # Enemies
-        for enemy in self.level.enemies[:]:
-            if enemy.update(self.level.platforms):
-                self.level.enemies.remove(enemy)
+        # Enemies - only those near the camera get physics, the rest wait
+        # where they are until the camera pans to them
+        camera_x = self.camera.x
+        active_range = DISPLAY_WIDTH + 64
+        # Mario's box doesn't move while enemies and coins are checked
+        mario = self.mario
+        mario_left = mario.x
+        mario_right = mario_left + mario.width
+        mario_top = mario.y
+        mario_bottom = mario_top + mario.height
+        # Walked backwards so a dead enemy can be swap-popped in place
+        # instead of copying the list every frame
+        level = self.level
+        enemies = level.enemies
+        for i in range(len(enemies) - 1, -1, -1):
+            enemy = enemies[i]
+            dx = enemy.x - camera_x
+            if dx > active_range or dx < -active_range:
+                continue
+            
+            if enemy.update(level):
+                enemies[i] = enemies[-1]
+                enemies.pop()
                 continue
                 
-            if enemy.alive and self.mario.invincible == 0:
-                if check_collision(
-                    self.mario.x, self.mario.y, self.mario.width, self.mario.height,
-                    enemy.x, enemy.y, enemy.width, enemy.height
-                ):
+            if enemy.alive and mario.invincible == 0:
+                ex = enemy.x
+                ey = enemy.y
+                if (mario_left < ex + enemy.width and mario_right > ex and
+                    mario_top < ey + enemy.height and mario_bottom > ey):
                     if self.mario.vel_y > 0 and self.mario.y < enemy.y:
                         enemy.stomp()
                         self.score += 100
-                        self.mario.vel_y = -6
+                        self.hud_dirty = True
+                        self.mario.vel_y = -6 * Q8
                         # self.audio_manager.play('stomp')  # Add smb_stomp.wav to enable
                     else:
                         self.lives -= 1
+                        self.hud_dirty = True
                         self.mario.invincible = 120
                         # self.audio_manager.play('death')  # Add smb_death.wav to enable
+                        gc.collect()  # MEMORY: pause is hidden by the hit blink
                         if self.lives <= 0:
                             self.game_over = True
                             self.audio_manager.play('gameover')  # Game over sound!
                             self.game_over_screen.show()
                             self.hud.hide()
                             
-        # Coins
-        for coin in self.level.coins:
-            if not coin.collected:
-                if check_collision(
-                    self.mario.x, self.mario.y, self.mario.width, self.mario.height,
-                    coin.x, coin.y, 8, 14
-                ):
-                    coin.collected = True
-                    self.coins += 1
-                    self.score += 200
-                    self.audio_manager.play('coin')  # Coin sound!
+        # Coins - only the draw buckets Mario overlaps can hold one he touches
+        coin_x, coin_y = level.coin_x, level.coin_y
+        coin_collected = level.coin_collected
+        coin_buckets = level.coin_buckets
+        for b in range((mario_left - 8) // DRAW_BUCKET_SIZE, mario_right // DRAW_BUCKET_SIZE + 1):
+            for i in coin_buckets.get(b, ()):
+                if not coin_collected[i]:
+                    cx = coin_x[i]
+                    cy = coin_y[i]
+                    if (mario_left < cx + 8 and mario_right > cx and
+                        mario_top < cy + 14 and mario_bottom > cy):
+                        coin_collected[i] = 1
+                        self.coins += 1
+                        self.score += 200
+                        self.hud_dirty = True
+                        self.audio_manager.play('coin')  # Coin sound!
                     
         # Level completion check - must reach the actual end (past flag pole at x=2050)
         if not self.level_complete and self.mario.x >= 2075:
@@ -1128,6 +1231,8 @@ class MarioGame:
             self.victory_screen.show(self.score, self.coins)
             self.hud.hide()
             
+            gc.collect()  # MEMORY: pause is hidden by the victory screen
+            
             print(f"\n🎉 LEVEL COMPLETE! 🎉")
             print(f"Final Score: {self.score}")
             print(f"Coins Collected: {self.coins}")
@@ -1135,6 +1240,7 @@ class MarioGame:
         # Fall death
         if self.mario.y > DISPLAY_HEIGHT:
             self.lives -= 1
+            self.hud_dirty = True
             # self.audio_manager.play('death')  # Add smb_death.wav to enable
             if self.lives <= 0:
                 self.game_over = True
@@ -1142,143 +1248,213 @@ class MarioGame:
                 self.game_over_screen.show()
                 self.hud.hide()
             else:
-                self.mario.x = 40
-                self.mario.y = GROUND_Y
+                self.mario.place(40, GROUND_Y)
                 self.mario.invincible = 120
+                gc.collect()  # MEMORY: pause is hidden by the respawn
                 
         # Update NeoPixels
         self.neopixels.update(self.mario, self.score, self.lives, self.level_complete)
         
+    def create_pool_sprite(self, tile_w, tile_h, tile, fallback_w, fallback_h, color):
+        """Create one hidden pool sprite from the atlas (or a colored fallback)"""
+        if self.sprite_loader.sprites_loaded:
+            sprite = displayio.TileGrid(
+                self.sprite_loader.sheet,
+                pixel_shader=self.sprite_loader.palette,
+                width=1, height=1,
+                tile_width=tile_w, tile_height=tile_h,
+                default_tile=tile,
+                x=0, y=0
+            )
+        else:
+            sprite = self.create_sprite(fallback_w, fallback_h, color)
+        sprite.hidden = True
+        return sprite
+    
+    def grow_platform_pool(self):
+        """Add one platform sprite when more are visible than the pool holds"""
+        sprite = self.create_pool_sprite(BLOCK_SIZE, BLOCK_SIZE, BLOCK_TILE,
+                                         BLOCK_SIZE, BLOCK_SIZE, 0xD87850)
+        self.platform_sprites.append(sprite)
+        self.platforms_group.append(sprite)
+        self.platform_tiles.append(-1)
+        if Debug:
+            print(f"Platform pool grown to {len(self.platform_sprites)}")
+    
     def draw(self):
         """Draw game by updating sprite positions - NO FLICKER VERSION"""
+        # Hoist everything the sprite loops touch into locals (each self./
+        # module lookup is a dict probe on CircuitPython)
+        cam_x = self.camera.x
+        level = self.level
+        loaded = self.sprite_loader.sprites_loaded
+        
         # Larger buffer zones to prevent edge flickering
         # Was 32, now 64 pixels on each side = 128 pixel total buffer
-        visible_left = self.camera.x - 64
-        visible_right = self.camera.x + DISPLAY_WIDTH + 64
+        visible_left = cam_x - 64
+        visible_right = cam_x + DISPLAY_WIDTH + 64
+        
+        # Scroll the ground strip by the camera's offset within one tile
+        # (positions are all whole pixels, so no int() casts below)
+        ground_x = -(cam_x % BLOCK_SIZE)
+        if self.ground_sprite.x != ground_x:
+            self.ground_sprite.x = ground_x
         
-        # Track which sprites we use this frame
-        used_platform_sprites = 0
-        used_enemy_sprites = 0
-        used_coin_sprites = 0
+        # Only the draw buckets overlapping the visible window are scanned;
+        # start one bucket early for objects that stick out of their bucket
+        first_bucket = visible_left // DRAW_BUCKET_SIZE - 1
+        last_bucket = visible_right // DRAW_BUCKET_SIZE
         
         # Update platform sprites (DON'T hide first, just update positions)
+        platform_sprites = self.platform_sprites
+        num_platform_sprites = len(platform_sprites)
+        platforms_shown = self.platforms_shown
         platform_index = 0
-        for platform in self.level.platforms:
-            # CRITICAL FIX: Check if ANY part of platform is visible (not just left edge)
-            # A platform is visible if its right edge is past the left boundary
-            # AND its left edge is before the right boundary
-            platform_right = platform.x + platform.width
-            if platform_right > visible_left and platform.x < visible_right:
-                if platform_index < len(self.platform_sprites):
-                    sprite = self.platform_sprites[platform_index]
+        px, pr, py, ptile = level.px, level.pr, level.py, level.ptile
+        draw_buckets = level.draw_buckets
+        platform_tiles = self.platform_tiles
+        for b in range(first_bucket, last_bucket + 1):
+            for i in draw_buckets.get(b, ()):
+                # CRITICAL FIX: Check if ANY part of platform is visible (not just left edge)
+                # A platform is visible if its right edge is past the left boundary
+                # AND its left edge is before the right boundary
+                platform_x = px[i]
+                if platform_x >= visible_right:
+                    break  # Sorted by x: the rest are off screen too
+                if pr[i] > visible_left:
+                    if platform_index == num_platform_sprites:
+                        self.grow_platform_pool()
+                        num_platform_sprites += 1
+                    sprite = platform_sprites[platform_index]
                     
                     # Update position
-                    new_x = int(platform.x - self.camera.x)
-                    new_y = int(platform.y)
+                    new_x = platform_x - cam_x
+                    new_y = py[i]
                     
                     # Only update if position changed (reduces display updates)
                     if sprite.x != new_x or sprite.y != new_y:
                         sprite.x = new_x
                         sprite.y = new_y
                     
-                    # Ensure visible
-                    if sprite.hidden:
+                    # Show slots that were hidden last frame
+                    if platform_index >= platforms_shown:
                         sprite.hidden = False
                     
-                    # OPTIMIZED: Use class-level TILE_MAP instead of creating dict every frame
-                    if self.sprite_loader.sprites_loaded:
-                        tile = self.TILE_MAP.get(platform.block_type, 0)
-                        sprite[0] = tile
+                    # OPTIMIZED: Only touch the TileGrid when this slot's tile changes
+                    if loaded:
+                        tile = ptile[i]
+                        if platform_tiles[platform_index] != tile:
+                            sprite[0] = tile
+                            platform_tiles[platform_index] = tile
                     
                     platform_index += 1
-                    used_platform_sprites = platform_index
-        
-        used_platform_sprites = platform_index
         
-        # Hide only the unused platform sprites
-        for i in range(used_platform_sprites, len(self.platform_sprites)):
-            if not self.platform_sprites[i].hidden:
-                self.platform_sprites[i].hidden = True
+        # Hide only the sprites that were shown last frame but not this one
+        hide_unused(platform_sprites, self.platforms_group, platform_index, self.platforms_shown)
+        self.platforms_shown = platform_index
                     
         # Update coin sprites (same pattern)
+        coin_sprites = self.coin_sprites
+        num_coin_sprites = len(coin_sprites)
+        coins_shown = self.coins_shown
         coin_index = 0
-        for coin in self.level.coins:
-            # Coins are 8 pixels wide - check if any part is visible
-            coin_right = coin.x + 8
-            if not coin.collected and coin_right > visible_left and coin.x < visible_right:
-                if coin_index < len(self.coin_sprites):
-                    sprite = self.coin_sprites[coin_index]
-                    
-                    new_x = int(coin.x - self.camera.x)
-                    new_y = int(coin.y)
-                    
-                    if sprite.x != new_x or sprite.y != new_y:
-                        sprite.x = new_x
-                        sprite.y = new_y
-                    
-                    if sprite.hidden:
-                        sprite.hidden = False
-                    
-                    coin_index += 1
-        
-        used_coin_sprites = coin_index
+        coin_xs, coin_ys = level.coin_x, level.coin_y
+        coin_collected = level.coin_collected
+        coin_buckets = level.coin_buckets
+        for b in range(first_bucket, last_bucket + 1):
+            for c in coin_buckets.get(b, ()):
+                # Coins are 8 pixels wide - check if any part is visible
+                coin_x = coin_xs[c]
+                if coin_x >= visible_right:
+                    break  # Sorted by x: the rest are off screen too
+                if not coin_collected[c] and coin_x + 8 > visible_left:
+                    if coin_index < num_coin_sprites:
+                        sprite = coin_sprites[coin_index]
+                        
+                        new_x = coin_x - cam_x
+                        new_y = coin_ys[c]
+                        
+                        if sprite.x != new_x or sprite.y != new_y:
+                            sprite.x = new_x
+                            sprite.y = new_y
+                        
+                        if coin_index >= coins_shown:
+                            sprite.hidden = False
+                        
+                        coin_index += 1
         
         # Hide unused coin sprites
-        for i in range(used_coin_sprites, len(self.coin_sprites)):
-            if not self.coin_sprites[i].hidden:
-                self.coin_sprites[i].hidden = True
+        hide_unused(coin_sprites, self.coins_group, coin_index, self.coins_shown)
+        self.coins_shown = coin_index
                     
         # Update enemy sprites (same pattern)
+        enemy_sprites = self.enemy_sprites
+        num_enemy_sprites = len(enemy_sprites)
+        enemies_shown = self.enemies_shown
+        enemy_tiles = self.enemy_tiles
         enemy_index = 0
-        for enemy in self.level.enemies:
+        for enemy in level.enemies:
             # Enemies are 16 pixels wide - check if any part is visible
-            enemy_right = enemy.x + enemy.width
-            if enemy.alive and enemy_right > visible_left and enemy.x < visible_right:
-                if enemy_index < len(self.enemy_sprites):
-                    sprite = self.enemy_sprites[enemy_index]
+            enemy_x = enemy.x
+            if enemy.alive and enemy_x + enemy.width > visible_left and enemy_x < visible_right:
+                if enemy_index < num_enemy_sprites:
+                    sprite = enemy_sprites[enemy_index]
                     
-                    new_x = int(enemy.x - self.camera.x)
-                    new_y = int(enemy.y)
+                    new_x = enemy_x - cam_x
+                    new_y = enemy.y
                     
                     if sprite.x != new_x or sprite.y != new_y:
                         sprite.x = new_x
                         sprite.y = new_y
                     
-                    if sprite.hidden:
+                    if enemy_index >= enemies_shown:
                         sprite.hidden = False
                     
-                    if self.sprite_loader.sprites_loaded:
-                        sprite[0] = enemy.sprite_frame
+                    if loaded:
+                        tile = GOOMBA_TILE + enemy.sprite_frame
+                        if enemy_tiles[enemy_index] != tile:
+                            sprite[0] = tile
+                            enemy_tiles[enemy_index] = tile
                     
                     enemy_index += 1
         
-        used_enemy_sprites = enemy_index
-        
         # Hide unused enemy sprites
-        for i in range(used_enemy_sprites, len(self.enemy_sprites)):
-            if not self.enemy_sprites[i].hidden:
-                self.enemy_sprites[i].hidden = True
+        hide_unused(enemy_sprites, self.enemies_group, enemy_index, self.enemies_shown)
+        self.enemies_shown = enemy_index
                     
-        if self.mario.invincible == 0 or self.mario.invincible % 10 < 5:
-            screen_x = int(self.mario.x - self.camera.x)
-            self.mario_sprite.x = screen_x
-            self.mario_sprite.y = int(self.mario.y)
-            self.mario_sprite.hidden = False
-            
+        mario = self.mario
+        mario_sprite = self.mario_sprite
+        drawn = self.mario_drawn
+        if mario.invincible == 0 or mario.invincible % 10 < 5:
             # OPTIMIZED: Only update sprite properties if they changed
-            if self.sprite_loader.sprites_loaded:
-                if self.mario.sprite_frame != self.last_mario_frame:
-                    self.mario_sprite[0] = self.mario.sprite_frame
-                    self.last_mario_frame = self.mario.sprite_frame
+            screen_x = mario.x - cam_x
+            if screen_x != drawn[2]:
+                mario_sprite.x = screen_x
+                drawn[2] = screen_x
+            if mario.y != drawn[3]:
+                mario_sprite.y = mario.y
+                drawn[3] = mario.y
+            if drawn[4]:
+                mario_sprite.hidden = False
+                drawn[4] = 0
+            
+            if loaded:
+                frame = mario.sprite_frame
+                if frame != drawn[0]:
+                    mario_sprite[0] = MARIO_TILE + frame
+                    drawn[0] = frame
                 
-                facing = not self.mario.facing_right
-                if facing != self.last_mario_flip:
-                    self.mario_sprite.flip_x = facing
-                    self.last_mario_flip = facing
-        else:
-            self.mario_sprite.hidden = True
-        
-        self.hud.update(self.score, self.coins, self.lives)
+                flip = 0 if mario.facing_right else 1
+                if flip != drawn[1]:
+                    mario_sprite.flip_x = flip == 1
+                    drawn[1] = flip
+        elif not drawn[4]:
+            mario_sprite.hidden = True
+            drawn[4] = 1
+        
+        if self.hud_dirty:
+            self.hud.update(self.score, self.coins, self.lives)
+            self.hud_dirty = False
     
     def reset_level(self):
         """Reset the level to start over"""
@@ -1295,6 +1471,7 @@ class MarioGame:
         self.score = 0
         self.coins = 0
         self.lives = 3
+        self.hud_dirty = True  # Score, coins or lives changed since the HUD was drawn
         self.game_over = False
         self.level_complete = False
         self.victory_timer = 0
@@ -1326,26 +1503,55 @@ class MarioGame:
         print("MEMORY LEAK FIXES ACTIVE - AGGRESSIVE GC")
         print("="*50 + "\n")
         
+        # MEMORY: sprites, HUD, screens, level and sounds live for the whole
+        # game - freeze them so later collections don't rescan them
+        gc.collect()
+        gc.collect()
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+        
+        # MEMORY: no automatic GC pauses during play - collect on scene
+        # changes (hit, respawn, level complete, reset) instead
+        gc.disable()
+        free_after_gc = gc.mem_free()
+        
         frame = 0
+        next_frame = time.monotonic_ns() + FRAME_NS
         
         while not self.game_over:
-            # CRITICAL: Poll button IMMEDIATELY at start of frame
-            # This catches presses that happened during draw() or sleep()
-            self.imu_control.poll_button_only()
-            
             self.update()
             self.draw()
             
             frame += 1
             
-            # MEMORY: Balanced garbage collection - every 90 frames (3 seconds at 30 FPS)
-            # MOVED HERE: GC only in main loop, NOT during audio playback!
-            if frame % 90 == 0:
+            # MEMORY: automatic GC is disabled, so collect only once the frame
+            # loop has actually allocated something worth reclaiming (or the
+            # heap runs low). Scene-change collections raise the baseline.
+            free = gc.mem_free()
+            if free > free_after_gc:
+                free_after_gc = free
+            elif free_after_gc - free > GC_ALLOC_BUDGET or free < GC_LOW_WATER:
                 gc.collect()
+                free_after_gc = gc.mem_free()
+            
+            if frame % 90 == 0:
                 if Debug or frame % 180 == 0:
                     print(f"Score: {self.score} | Coins: {self.coins} | Lives: {self.lives} | Free RAM: {gc.mem_free()}")
                 
-            time.sleep(0.033)
+            # Pace to a deadline rather than a fixed sleep, so a slow frame is
+            # made up by the next one. Keep polling the button while we wait.
+            remaining = next_frame - time.monotonic_ns()
+            while remaining > 5_000_000:
+                time.sleep(0.005)
+                self.imu_control.poll_button_only()
+                remaining = next_frame - time.monotonic_ns()
+            if remaining > 0:
+                time.sleep(remaining / 1_000_000_000)
+            elif remaining < -FRAME_NS:
+                # More than a frame behind (GC, screen change) - don't rush
+                # to catch up, just start counting from now
+                next_frame -= remaining
+            next_frame += FRAME_NS
             
         # Game over - hold screen and let audio play
         print(f"\n{'='*50}")
@@ -1357,18 +1563,15 @@ class MarioGame:
             self.neopixels.pixels.fill(0xFF0000)
             self.neopixels.pixels.show()
         
-        # Hold the game over screen for 5 seconds and let audio finish playing
+        # Hold the game over screen for 5 seconds and let audio finish playing,
+        # waking once a second to report on the audio
         print("Displaying game over screen...")
-        hold_frames = 150  # 5 seconds at 30 FPS
-        for i in range(hold_frames):
-            # Keep display active but don't update game state
-            time.sleep(0.033)
-            # Check if audio is still playing, if finished we can wait quietly
-            if i % 30 == 0:  # Every second
-                if self.audio_manager.is_playing():
-                    print(f"  Game over audio playing... ({i//30 + 1}s)")
-                else:
-                    print(f"  Holding screen... ({i//30 + 1}s)")
+        for second in range(1, 6):
+            if self.audio_manager.is_playing():
+                print(f"  Game over audio playing... ({second}s)")
+            else:
+                print(f"  Holding screen... ({second}s)")
+            time.sleep(1.0)
         
         print("Game over sequence complete.")
             
@@ -2,236 +2,365 @@
 Simple Sprite Generator for CircuitPython Mario
 Creates indexed BMP files suitable for displayio
 
-This script generates simple pixel art sprites for Mario, Goombas, and blocks.
-Run on your host computer with Python 3, then copy the .bmp files to your CircuitPython board.
+This script generates simple pixel art sprites for Mario, Goombas, and blocks
+and packs them into a single 144x16 atlas (sprite_atlas.bmp) with one shared palette.
+Run on your host computer with Python 3, then copy the .bmp file to your CircuitPython board.
+
+Atlas layout (16x16 tiles unless noted):
+    tiles 0-2   Mario (standing, walking, jumping)
+    tiles 3-4   Goomba (2 walk frames)
+    tiles 5-7   Blocks (brick, question, pipe)
+    x 128-135   Coin (8x14, tile 16 when the atlas is split into 8x16 tiles)
+
+The atlas is only rewritten when its contents change (a CRC32 is kept in
+sprite_atlas.bmp.crc); run with --force to always rewrite it.
 
 Requirements:
-    pip install pillow
+    pip install numpy
+    pip install numba   (optional, compiles the Mario leg drawing)
 """
 
-from PIL import Image, ImageDraw
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+# numba is optional: when installed, draw_mario_legs is compiled to
+# straight-line stores, otherwise it runs as plain numpy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Palettes (16 colors for compatibility, the rest black), built once as bytes
+MARIO_PALETTE = bytes([
+    0, 0, 0,         # 0: Black
+    255, 0, 0,       # 1: Red (Mario's shirt)
+    0, 0, 255,       # 2: Blue (Mario's overalls)
+    255, 200, 150,   # 3: Skin color
+    139, 69, 19,     # 4: Brown (hair/shoes)
+    255, 255, 255,   # 5: White
+]) + bytes(30)
+
+GOOMBA_PALETTE = bytes([
+    0, 0, 0,         # 0: Black
+    139, 69, 19,     # 1: Brown (body)
+    210, 105, 30,    # 2: Light brown
+    255, 255, 255,   # 3: White (eyes)
+]) + bytes(36)
+
+BLOCK_PALETTE = bytes([
+    0, 0, 0,         # 0: Black
+    216, 120, 80,    # 1: Brick red
+    252, 188, 0,     # 2: Question block yellow
+    0, 170, 0,       # 3: Pipe green
+    255, 255, 255,   # 4: White
+    160, 82, 45,     # 5: Dark brick
+]) + bytes(30)
+
+COIN_PALETTE = bytes([
+    0, 0, 0,         # 0: Black (transparent)
+    252, 188, 0,     # 1: Gold
+    255, 215, 0,     # 2: Light gold
+]) + bytes(45)
+
+# Shared atlas palette: every color used by the sheets above, once
+ATLAS_PALETTE = bytes([
+    0, 0, 0,         # 0: Black
+    255, 0, 0,       # 1: Red (Mario's shirt)
+    0, 0, 255,       # 2: Blue (Mario's overalls)
+    255, 200, 150,   # 3: Skin color
+    139, 69, 19,     # 4: Brown (hair/shoes, Goomba body)
+    255, 255, 255,   # 5: White
+    210, 105, 30,    # 6: Light brown (Goomba belly)
+    216, 120, 80,    # 7: Brick red
+    252, 188, 0,     # 8: Question block yellow / coin gold
+    0, 170, 0,       # 9: Pipe green
+    160, 82, 45,     # 10: Dark brick
+    255, 215, 0,     # 11: Light gold
+]) + bytes(12)
+
+ATLAS_WIDTH = 144
+ATLAS_HEIGHT = 16
+
+# Mario's head and body are identical in all 3 frames, so their columns
+# are listed for every frame at once (frames start at x = 0, 16, 32)
+MARIO_HEAD_COLS = np.r_[5:11, 21:27, 37:43]
+MARIO_HAIR_COLS = np.r_[4:12, 20:28, 36:44]
+MARIO_EYE_COLS = np.r_[6, 22, 38, 9, 25, 41]
+
+# Goomba pixels shared by both frames (frames start at x = 0, 16)
+GOOMBA_BELLY_COLS = np.r_[5:11, 21:27]
+GOOMBA_FEET_COLS = np.r_[3:6, 10:13, 18:21, 27:30]   # Frame 1 feet are spread (walking)
+GOOMBA_DARK_PIXELS = np.array([   # (y, x) of the pupils and angry eyebrows in frame 0
+    (8, 6), (8, 9),
+    (6, 4), (6, 5), (7, 6), (7, 7),
+    (6, 11), (6, 10), (7, 9), (7, 8),
+])
+
+# Literal pixel rows are converted with one bytes.translate call each
+PIXEL_DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+MASK_CELLS = bytes.maketrans(b'.#', b'\x00\x01')
+
+def pixel_rows(rows, table=PIXEL_DIGITS):
+    """Turn rows of palette-index digits into a uint8 pixel array"""
+    buf = ''.join(rows).encode().translate(table)
+    return np.frombuffer(buf, dtype=np.uint8).reshape(len(rows), -1)
+
+def bool_mask(rows):
+    """Turn rows of '#'/'.' characters into a boolean numpy mask"""
+    return pixel_rows(rows, MASK_CELLS).astype(np.bool_)
+
+# Goomba ellipses are drawn from fixed masks ('#' = inside) that match how
+# the original Pillow version rasterized them
+GOOMBA_BODY_MASK = bool_mask((
+    "...####...",
+    "..######..",
+    ".########.",
+    "##########",
+    "##########",
+    "##########",
+    "##########",
+    ".########.",
+    "..######..",
+    "...####...",
+))
+
+GOOMBA_EYE_MASK = bool_mask((
+    ".#.",
+    "###",
+    ".#.",
+))
+
+# Coin (gold with a light gold outline and highlight), 8x14
+COIN_SPRITE = pixel_rows((
+    "00000000",
+    "00000000",
+    "00022000",
+    "00211200",
+    "02122120",
+    "02222220",
+    "02222220",
+    "02222220",
+    "02222220",
+    "02122120",
+    "00211200",
+    "00022000",
+    "00000000",
+    "00000000",
+))
+
+def fill_mask(arr, x0, y0, mask, color):
+    """Paint the True pixels of a boolean mask with its top-left corner at (x0, y0)"""
+    height, width = mask.shape
+    arr[y0:y0 + height, x0:x0 + width][mask] = color
+
+def palette_remap(palette):
+    """Build a LUT mapping a sheet's palette indices to ATLAS_PALETTE indices"""
+    atlas_colors = [ATLAS_PALETTE[i:i + 3] for i in range(0, len(ATLAS_PALETTE), 3)]
+    return np.array([atlas_colors.index(palette[i:i + 3])
+                     for i in range(0, len(palette), 3)], dtype=np.uint8)
+
+def save_indexed_bmp(path, arr, palette):
+    """Write a pixel array as an 8-bit indexed BMP with one file write"""
+    height, width = arr.shape
+    colors = len(palette) // 3
+    row_size = (width + 3) & ~3  # rows are padded to 4 bytes
+    image_size = row_size * height
+    pixel_offset = 14 + 40 + colors * 4
+    
+    # BITMAPFILEHEADER + BITMAPINFOHEADER (96 DPI, all palette colors used)
+    header = struct.pack('<2sIHHIIiiHHIIiiII',
+                         b'BM', pixel_offset + image_size, 0, 0, pixel_offset,
+                         40, width, height, 1, 8, 0, image_size, 3780, 3780, colors, colors)
+    
+    # Palette entries are B, G, R, 0
+    quads = bytearray(colors * 4)
+    quads[0::4] = palette[2::3]
+    quads[1::4] = palette[1::3]
+    quads[2::4] = palette[0::3]
+    
+    # Pixel rows are stored bottom-up
+    rows = np.zeros((height, row_size), dtype=np.uint8)
+    rows[:, :width] = arr
+    
+    with open(path, 'wb') as f:
+        f.write(header + quads + rows[::-1].tobytes())
+
+def draw_mario_legs(arr, x0, leg_style):
+    """Draw the legs of the Mario frame at column x0 (leg_style 0: stand, 1: walk, 2: jump)"""
+    if leg_style == 0:
+        arr[13:16, x0+5:x0+8] = 2    # Left leg
+        arr[13:16, x0+8:x0+11] = 2   # Right leg
+        arr[15, x0+4:x0+7] = 4       # Left shoe
+        arr[15, x0+9:x0+12] = 4      # Right shoe
+    elif leg_style == 1:
+        arr[13:16, x0+4:x0+7] = 2    # Left leg forward
+        arr[13:16, x0+9:x0+12] = 2   # Right leg back
+        arr[15, x0+3:x0+6] = 4
+        arr[15, x0+10:x0+13] = 4
+    else:
+        arr[13:16, x0+3:x0+6] = 2
+        arr[13:16, x0+10:x0+13] = 2
+
+if NUMBA_AVAILABLE:
+    draw_mario_legs = njit(cache=True)(draw_mario_legs)
+
+def is_up_to_date(path, checksum):
+    """True if path exists and its .crc sidecar matches checksum"""
+    try:
+        with open(path + '.crc') as f:
+            return os.path.exists(path) and int(f.read(), 16) == checksum
+    except (OSError, ValueError):
+        return False
 
 def create_mario_sprites():
     """Create Mario sprite sheet with standing, walking, and jumping frames"""
     # 48x16 image (3 frames of 16x16)
-    img = Image.new('P', (48, 16))
-    
-    # Define a simple palette (16 colors for compatibility)
-    palette = [
-        0, 0, 0,         # 0: Black
-        255, 0, 0,       # 1: Red (Mario's shirt)
-        0, 0, 255,       # 2: Blue (Mario's overalls)
-        255, 200, 150,   # 3: Skin color
-        139, 69, 19,     # 4: Brown (hair/shoes)
-        255, 255, 255,   # 5: White
-    ] + [0] * 30  # Fill rest with black
-    
-    img.putpalette(palette)
-    draw = ImageDraw.Draw(img)
-    
-    # Frame 0: Standing Mario (16x16)
-    # Head
-    draw.rectangle([5, 2, 10, 7], fill=3)  # Face
-    draw.rectangle([4, 2, 11, 3], fill=4)  # Hair
-    draw.point((6, 4), fill=0)  # Eye
-    draw.point((9, 4), fill=0)  # Eye
-    
-    # Body
-    draw.rectangle([5, 8, 10, 12], fill=1)  # Red shirt
-    draw.rectangle([4, 9, 11, 10], fill=2)  # Blue straps
-    
-    # Legs
-    draw.rectangle([5, 13, 7, 15], fill=2)   # Left leg
-    draw.rectangle([8, 13, 10, 15], fill=2)  # Right leg
-    draw.rectangle([4, 15, 6, 15], fill=4)   # Left shoe
-    draw.rectangle([9, 15, 11, 15], fill=4)  # Right shoe
-    
-    # Frame 1: Walking Mario (offset by 16 pixels)
-    x_offset = 16
-    # Head
-    draw.rectangle([5+x_offset, 2, 10+x_offset, 7], fill=3)
-    draw.rectangle([4+x_offset, 2, 11+x_offset, 3], fill=4)
-    draw.point((6+x_offset, 4), fill=0)
-    draw.point((9+x_offset, 4), fill=0)
-    
-    # Body
-    draw.rectangle([5+x_offset, 8, 10+x_offset, 12], fill=1)
-    draw.rectangle([4+x_offset, 9, 11+x_offset, 10], fill=2)
-    
-    # Legs (walking pose)
-    draw.rectangle([4+x_offset, 13, 6+x_offset, 15], fill=2)   # Left leg forward
-    draw.rectangle([9+x_offset, 13, 11+x_offset, 15], fill=2)  # Right leg back
-    draw.rectangle([3+x_offset, 15, 5+x_offset, 15], fill=4)
-    draw.rectangle([10+x_offset, 15, 12+x_offset, 15], fill=4)
-    
-    # Frame 2: Jumping Mario (offset by 32 pixels)
-    x_offset = 32
-    # Head
-    draw.rectangle([5+x_offset, 2, 10+x_offset, 7], fill=3)
-    draw.rectangle([4+x_offset, 2, 11+x_offset, 3], fill=4)
-    draw.point((6+x_offset, 4), fill=0)
-    draw.point((9+x_offset, 4), fill=0)
-    
-    # Body
-    draw.rectangle([5+x_offset, 8, 10+x_offset, 12], fill=1)
-    draw.rectangle([4+x_offset, 9, 11+x_offset, 10], fill=2)
-    
-    # Legs (jumping pose)
-    draw.rectangle([3+x_offset, 13, 5+x_offset, 15], fill=2)
-    draw.rectangle([10+x_offset, 13, 12+x_offset, 15], fill=2)
-    
-    img.save('mario_sprites.bmp')
-    print("Created mario_sprites.bmp (48x16, 3 frames)")
+    arr = np.zeros((16, 48), dtype=np.uint8)
+    
+    # Shared head and body, written to all frames in one store each
+    arr[2:8, MARIO_HEAD_COLS] = 3    # Face
+    arr[2:4, MARIO_HAIR_COLS] = 4    # Hair
+    arr[4, MARIO_EYE_COLS] = 0       # Eyes
+    arr[8:13, MARIO_HEAD_COLS] = 1   # Red shirt
+    arr[9:11, MARIO_HAIR_COLS] = 2   # Blue straps
+    
+    # Then only the legs differ per frame
+    draw_mario_legs(arr, 0, 0)    # Frame 0: Standing
+    draw_mario_legs(arr, 16, 1)   # Frame 1: Walking
+    draw_mario_legs(arr, 32, 2)   # Frame 2: Jumping
+    
+    print("Created Mario sprites (48x16, 3 frames)")
+    return arr
 
 def create_goomba_sprites():
     """Create Goomba enemy sprite sheet"""
     # 32x16 image (2 frames for walk animation)
-    img = Image.new('P', (32, 16))
-    
-    palette = [
-        0, 0, 0,         # 0: Black
-        139, 69, 19,     # 1: Brown (body)
-        210, 105, 30,    # 2: Light brown
-        255, 255, 255,   # 3: White (eyes)
-    ] + [0] * 36
-    
-    img.putpalette(palette)
-    draw = ImageDraw.Draw(img)
-    
-    # Frame 0: Goomba standing
-    # Body
-    draw.ellipse([3, 4, 12, 13], fill=1)
-    draw.rectangle([5, 6, 10, 11], fill=2)  # Lighter belly
-    
-    # Eyes
-    draw.ellipse([5, 7, 7, 9], fill=3)   # Left eye white
-    draw.ellipse([8, 7, 10, 9], fill=3)  # Right eye white
-    draw.point((6, 8), fill=0)           # Left pupil
-    draw.point((9, 8), fill=0)           # Right pupil
-    
-    # Feet
-    draw.rectangle([3, 14, 5, 15], fill=1)
-    draw.rectangle([10, 14, 12, 15], fill=1)
-    
-    # Eyebrows (angry look)
-    draw.line([(4, 6), (7, 7)], fill=0)
-    draw.line([(11, 6), (8, 7)], fill=0)
-    
-    # Frame 1: Goomba walking (offset by 16)
-    x_offset = 16
-    draw.ellipse([3+x_offset, 4, 12+x_offset, 13], fill=1)
-    draw.rectangle([5+x_offset, 6, 10+x_offset, 11], fill=2)
-    
-    # Eyes
-    draw.ellipse([5+x_offset, 7, 7+x_offset, 9], fill=3)
-    draw.ellipse([8+x_offset, 7, 10+x_offset, 9], fill=3)
-    draw.point((6+x_offset, 8), fill=0)
-    draw.point((9+x_offset, 8), fill=0)
-    
-    # Feet (walking)
-    draw.rectangle([2+x_offset, 14, 4+x_offset, 15], fill=1)
-    draw.rectangle([11+x_offset, 14, 13+x_offset, 15], fill=1)
-    
-    # Eyebrows
-    draw.line([(4+x_offset, 6), (7+x_offset, 7)], fill=0)
-    draw.line([(11+x_offset, 6), (8+x_offset, 7)], fill=0)
-    
-    img.save('goomba_sprites.bmp')
-    print("Created goomba_sprites.bmp (32x16, 2 frames)")
+    arr = np.zeros((16, 32), dtype=np.uint8)
+    
+    # Drawn one color at a time across both frames, back to front
+    # Brown: body and feet
+    fill_mask(arr, 3, 4, GOOMBA_BODY_MASK, 1)
+    fill_mask(arr, 19, 4, GOOMBA_BODY_MASK, 1)
+    arr[14:16, GOOMBA_FEET_COLS] = 1
+    
+    # Light brown: belly
+    arr[6:12, GOOMBA_BELLY_COLS] = 2
+    
+    # White: eyes
+    for x in (5, 8, 21, 24):
+        fill_mask(arr, x, 7, GOOMBA_EYE_MASK, 3)
+    
+    # Black: pupils and eyebrows (angry look)
+    ys, xs = GOOMBA_DARK_PIXELS.T
+    arr[ys, xs] = 0
+    arr[ys, xs + 16] = 0
+    
+    print("Created Goomba sprites (32x16, 2 frames)")
+    return arr
 
 def create_block_sprites():
     """Create block sprite sheet (brick, question, pipe)"""
-    # 48x16 image (3 block types)
-    img = Image.new('P', (48, 16))
-    
-    palette = [
-        0, 0, 0,         # 0: Black
-        216, 120, 80,    # 1: Brick red
-        252, 188, 0,     # 2: Question block yellow
-        0, 170, 0,       # 3: Pipe green
-        255, 255, 255,   # 4: White
-        160, 82, 45,     # 5: Dark brick
-    ] + [0] * 30
-    
-    img.putpalette(palette)
-    draw = ImageDraw.Draw(img)
-    
-    # Brick block (0-15, 0-15)
-    draw.rectangle([0, 0, 15, 15], fill=1, outline=5)
-    # Brick pattern
-    draw.line([(0, 4), (15, 4)], fill=5)
-    draw.line([(0, 8), (15, 8)], fill=5)
-    draw.line([(0, 12), (15, 12)], fill=5)
-    draw.line([(8, 0), (8, 4)], fill=5)
-    draw.line([(4, 4), (4, 8)], fill=5)
-    draw.line([(12, 8), (12, 12)], fill=5)
-    draw.line([(8, 12), (8, 15)], fill=5)
-    
-    # Question block (16-31, 0-15)
-    x_offset = 16
-    draw.rectangle([x_offset, 0, x_offset+15, 15], fill=2, outline=0)
-    # Question mark
-    draw.rectangle([x_offset+6, x_offset-11, x_offset+9, x_offset-9], fill=4)  # Top of ?
-    draw.rectangle([x_offset+9, x_offset-11, x_offset+11, x_offset-6], fill=4) # Right of ?
-    draw.rectangle([x_offset+6, x_offset-6, x_offset+9, x_offset-4], fill=4)   # Middle of ?
-    draw.point((x_offset+7, x_offset-2), fill=4)  # Dot
-    
-    # Pipe block (32-47, 0-15)
-    x_offset = 32
-    draw.rectangle([x_offset, 0, x_offset+15, 15], fill=3, outline=0)
-    # Pipe details
-    draw.rectangle([x_offset+2, x_offset-14, x_offset+13, x_offset-13], fill=0)
-    draw.rectangle([x_offset+2, 2, x_offset+13, 3], fill=0)
-    draw.line([(x_offset+5, 0), (x_offset+5, 15)], fill=0)
-    draw.line([(x_offset+10, 0), (x_offset+10, 15)], fill=0)
-    
-    img.save('block_sprites.bmp')
-    print("Created block_sprites.bmp (48x16, 3 block types)")
+    # 48x16 image (3 block types), drawn one color at a time
+    arr = np.zeros((16, 48), dtype=np.uint8)
+    
+    # Block faces
+    arr[:, 0:16] = 1     # Brick (0-15)
+    arr[:, 16:32] = 2    # Question block (16-31)
+    arr[:, 32:48] = 3    # Pipe (32-47)
+    
+    # Dark brick: brick outline and pattern
+    arr[[0, 4, 8, 12, 15], 0:16] = 5
+    arr[:, [0, 15]] = 5
+    arr[0:5, 8] = 5
+    arr[4:9, 4] = 5
+    arr[8:13, 12] = 5
+    arr[12:16, 8] = 5
+    
+    # Black: question and pipe outlines, pipe details
+    arr[[0, 15], 16:48] = 0
+    arr[:, [16, 31, 32, 47]] = 0
+    arr[2:4, 34:46] = 0
+    arr[:, [37, 42]] = 0
+    
+    # White: question mark
+    arr[5:8, 22:26] = 4     # Top of ?
+    arr[5:11, 25:28] = 4    # Right of ?
+    arr[10:13, 22:26] = 4   # Middle of ?
+    arr[14, 23] = 4         # Dot
+    
+    print("Created block sprites (48x16, 3 block types)")
+    return arr
 
 def create_coin_sprite():
     """Create coin sprite"""
-    img = Image.new('P', (8, 14))
-    
-    palette = [
-        0, 0, 0,         # 0: Black (transparent)
-        252, 188, 0,     # 1: Gold
-        255, 215, 0,     # 2: Light gold
-    ] + [0] * 45
-    
-    img.putpalette(palette)
-    draw = ImageDraw.Draw(img)
-    
-    # Coin
-    draw.ellipse([1, 2, 6, 11], fill=1, outline=2)
-    draw.ellipse([2, 4, 5, 9], fill=2)  # Highlight
-    
-    img.save('coin_sprite.bmp')
-    print("Created coin_sprite.bmp (8x14)")
+    print("Created coin sprite (8x14)")
+    return COIN_SPRITE
+
+# (generator, palette, atlas x offset) for every sheet in the atlas
+ATLAS_SHEETS = (
+    (create_mario_sprites, MARIO_PALETTE, 0),
+    (create_goomba_sprites, GOOMBA_PALETTE, 48),
+    (create_block_sprites, BLOCK_PALETTE, 80),
+    (create_coin_sprite, COIN_PALETTE, 128),
+)
 
-def create_all_sprites():
-    """Generate all sprite files"""
-    print("Generating Mario sprite sheets...")
+def create_all_sprites(force=False):
+    """Generate the sprite atlas (skipped if unchanged unless force is set)"""
+    print("Generating Mario sprite atlas...")
     print("-" * 40)
     
     try:
-        create_mario_sprites()
-        create_goomba_sprites()
-        create_block_sprites()
-        create_coin_sprite()
+        atlas = np.zeros((ATLAS_HEIGHT, ATLAS_WIDTH), dtype=np.uint8)
+        failed = []
+        
+        # The sheets are independent: draw them in parallel, and let one
+        # failing generator report its error without stopping the others
+        with ThreadPoolExecutor(max_workers=len(ATLAS_SHEETS)) as executor:
+            futures = {executor.submit(generator): (generator, palette, x)
+                       for generator, palette, x in ATLAS_SHEETS}
+            for future in as_completed(futures):
+                generator, palette, x = futures[future]
+                try:
+                    sheet = future.result()
+                except Exception as e:
+                    print(f"Error in {generator.__name__}: {e}")
+                    failed.append(generator.__name__)
+                    continue
+                
+                # Remap into the shared palette at the sheet's atlas x offset
+                height, width = sheet.shape
+                atlas[0:height, x:x + width] = palette_remap(palette)[sheet]
+        
+        if failed:
+            print("-" * 40)
+            print(f"\nsprite_atlas.bmp not written, {len(failed)} sheet(s) failed: {', '.join(failed)}")
+            return
+        
+        checksum = zlib.crc32(atlas.tobytes(), zlib.crc32(ATLAS_PALETTE))
+        if not force and is_up_to_date('sprite_atlas.bmp', checksum):
+            print("-" * 40)
+            print("\nsprite_atlas.bmp is already up to date (use --force to rewrite it)")
+            return
+        
+        save_indexed_bmp('sprite_atlas.bmp', atlas, ATLAS_PALETTE)
+        with open('sprite_atlas.bmp.crc', 'w') as f:
+            f.write(f"{checksum:08x}\n")
         
         print("-" * 40)
-        print("\nSuccess! Created sprite files:")
-        print("  - mario_sprites.bmp")
-        print("  - goomba_sprites.bmp")
-        print("  - block_sprites.bmp")
-        print("  - coin_sprite.bmp")
-        print("\nCopy these .bmp files to your CircuitPython board's root directory.")
-        print("\nTo use in your code, load them with:")
-        print("  sprite_sheet, palette = adafruit_imageload.load('/mario_sprites.bmp')")
+        print("\nSuccess! Created sprite_atlas.bmp (144x16)")
+        print("\nCopy sprite_atlas.bmp to the /Sprites/ folder on your CircuitPython board.")
+        print("\nTo use in your code, load it with:")
+        print("  sprite_sheet, palette = adafruit_imageload.load('/Sprites/sprite_atlas.bmp')")
         
     except Exception as e:
         print(f"\nError generating sprites: {e}")
-        print("Make sure you have Pillow installed: pip install pillow")
+        print("Make sure you have numpy installed: pip install numpy")
 
 if __name__ == "__main__":
-    create_all_sprites()
+    create_all_sprites(force="--force" in sys.argv[1:])